@@ -0,0 +1,92 @@
+"""
+Benchmark cross-session micro-batching against one predict call per window.
+
+Simulates N websocket sessions that each request a prediction per frame and
+reports predictions per second and mean latency for:
+- unbatched: every window is its own model call on the thread pool
+- batched:   windows go through BatchScheduler (max batch size / max wait)
+
+Without --model-path an untrained LSTM of the same shape is built.
+
+Usage (from project root):
+    python -m src.benchmarks.batch_inference --sessions 1 8 32
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import tensorflow as tf
+
+from src import config
+from src.utils.batch_scheduler import BatchScheduler
+from src.utils.feature_schema import get_schema, load_model_schema
+
+
+def load_predictor(model_path: Optional[Path]) -> Tuple[Callable[[np.ndarray], np.ndarray], int]:
+    """Batched predict function and its feature width."""
+    from src.models.lstm_classifier import build_model, compile_predict
+
+    if model_path is not None:
+        model = tf.keras.models.load_model(model_path)
+        num_features = load_model_schema(model_path).num_features
+    else:
+        num_features = get_schema().num_features
+        model = build_model(num_classes=5, num_features=num_features)
+    return compile_predict(model, num_features), num_features
+
+
+async def run_sessions(sessions: int, frames: int, predict_one: Callable, num_features: int):
+    window = np.random.default_rng(0).random((config.SEQUENCE_LENGTH, num_features), dtype=np.float32)
+    latencies: List[float] = []
+
+    async def session():
+        for _ in range(frames):
+            start = time.perf_counter()
+            await predict_one(window)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return sessions * frames / elapsed, float(np.mean(latencies)) * 1000
+
+
+async def run(session_counts: List[int], frames: int, model_path: Optional[Path], max_batch: int, max_wait_ms: float):
+    predict, num_features = load_predictor(model_path)
+    executor = ThreadPoolExecutor(max_workers=config.SERVER_WORKERS)
+    predict(np.zeros((1, config.SEQUENCE_LENGTH, num_features), dtype=np.float32))  # trace once
+
+    async def unbatched(window):
+        loop = asyncio.get_running_loop()
+        return (await loop.run_in_executor(executor, predict, window[None]))[0]
+
+    print(f"  {'sessions':>8s} {'mode':10s} {'preds/s':>9s} {'latency ms':>11s} {'mean batch':>11s}")
+    for sessions in session_counts:
+        rate, latency = await run_sessions(sessions, frames, unbatched, num_features)
+        print(f"  {sessions:8d} {'unbatched':10s} {rate:9.1f} {latency:11.2f} {1.0:11.1f}")
+        scheduler = BatchScheduler(predict, max_batch, max_wait_ms, executor)
+        rate, latency = await run_sessions(sessions, frames, scheduler.predict, num_features)
+        scheduler.close()
+        print(f"  {sessions:8d} {'batched':10s} {rate:9.1f} {latency:11.2f} {scheduler.stats()['mean_batch_size']:11.1f}")
+    executor.shutdown()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark micro-batched LSTM inference.")
+    parser.add_argument("--sessions", nargs="+", type=int, default=[1, 4, 16, 32])
+    parser.add_argument("--frames", type=int, default=50, help="Predictions per session.")
+    parser.add_argument("--model-path", type=Path, default=None)
+    parser.add_argument("--max-batch", type=int, default=config.BATCH_MAX_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=config.BATCH_MAX_WAIT_MS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(run(args.sessions, args.frames, args.model_path, args.max_batch, args.max_wait_ms))
@@ -0,0 +1,94 @@
+"""
+Benchmark the landmark extractor backends on the bundled video clips.
+
+For each backend the clips are run twice:
+- blocking:  extract() per frame, the way convert_videos.py uses it
+- pipelined: submit() every frame and poll() for whatever has finished, the
+             way server.py and inference.py use it
+
+Usage (from project root):
+    python -m src.benchmarks.extractor_backends --root video_dataset --backends solutions tasks
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import List
+
+import cv2
+import numpy as np
+
+from src.utils.extractors import EXTRACTOR_BACKENDS, create_extractor
+
+
+def load_frames(root: Path, max_frames: int, pattern: str = "*/*") -> List[np.ndarray]:
+    frames = []
+    for video_path in sorted(root.glob(pattern)):
+        cap = cv2.VideoCapture(str(video_path))
+        while len(frames) < max_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+    return frames
+
+
+def run_blocking(backend: str, frames: List[np.ndarray]):
+    extractor = create_extractor(backend)
+    try:
+        start = time.perf_counter()
+        found = sum(extractor.extract(frame) is not None for frame in frames)
+        return time.perf_counter() - start, found, len(frames)
+    finally:
+        extractor.close()
+
+
+def run_pipelined(backend: str, frames: List[np.ndarray], drain_timeout: float = 5.0):
+    extractor = create_extractor(backend)
+    try:
+        results = []
+        start = time.perf_counter()
+        for frame in frames:
+            extractor.submit(frame)
+            results.extend(extractor.poll())
+        # Let in-flight frames finish; dropped ones never arrive
+        deadline = time.monotonic() + drain_timeout
+        while len(results) + extractor.stats().get("dropped_frames", 0) < len(frames):
+            if time.monotonic() > deadline:
+                break
+            time.sleep(0.005)
+            results.extend(extractor.poll())
+        elapsed = time.perf_counter() - start
+        return elapsed, sum(r is not None for r in results), len(results)
+    finally:
+        extractor.close()
+
+
+def run(root: Path, backends: List[str], max_frames: int):
+    frames = load_frames(root, max_frames)
+    if not frames:
+        raise SystemExit(f"No video frames found under {root}")
+    print(f"Loaded {len(frames)} frames from {root}\n")
+    print(f"  {'backend':10s} {'mode':10s} {'fps':>8s} {'ms/frame':>9s} {'results':>8s} {'person':>7s}")
+    for backend in backends:
+        for mode, fn in (("blocking", run_blocking), ("pipelined", run_pipelined)):
+            elapsed, found, completed = fn(backend, frames)
+            print(
+                f"  {backend:10s} {mode:10s} {len(frames) / elapsed:8.1f} "
+                f"{elapsed / len(frames) * 1000:9.1f} {completed:8d} {found:7d}"
+            )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark landmark extractor backends.")
+    parser.add_argument("--root", type=str, default="video_dataset", help="Video dataset root folder.")
+    parser.add_argument("--backends", nargs="+", choices=EXTRACTOR_BACKENDS, default=list(EXTRACTOR_BACKENDS))
+    parser.add_argument("--max-frames", type=int, default=300, help="Frames to load across all clips.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(Path(args.root), args.backends, args.max_frames)
@@ -0,0 +1,101 @@
+"""
+Microbenchmark: list-based landmark extraction vs packing into a preallocated buffer.
+
+Feeds both paths the same synthetic MediaPipe-shaped results (two hands, a
+refined 478-point face mesh and a full pose), checks they produce identical
+vectors, then reports time and traced allocations per frame.
+
+Usage:
+    python -m src.benchmarks.landmark_packing --frames 2000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+
+from src import config
+from src.utils.mediapipe_utils import (
+    combine_landmarks,
+    face_landmarks_from_results,
+    hand_landmarks_from_results,
+    pack_combined_landmarks,
+    pose_landmarks_from_results,
+)
+
+
+def _landmark_list(n: int, rng: np.random.Generator):
+    return SimpleNamespace(
+        landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in rng.random((n, 3))]
+    )
+
+
+def make_fake_results(seed: int = 0, face_points: int = 478):
+    """Objects shaped like Hands / FaceMesh / Pose .process() results."""
+    rng = np.random.default_rng(seed)
+    hand_results = SimpleNamespace(
+        multi_hand_landmarks=[_landmark_list(21, rng), _landmark_list(21, rng)],
+        multi_handedness=[
+            SimpleNamespace(classification=[SimpleNamespace(label="Right")]),
+            SimpleNamespace(classification=[SimpleNamespace(label="Left")]),
+        ],
+    )
+    face_results = SimpleNamespace(multi_face_landmarks=[_landmark_list(face_points, rng)])
+    pose_results = SimpleNamespace(pose_landmarks=_landmark_list(33, rng))
+    return hand_results, face_results, pose_results
+
+
+def legacy_path(hand_results, face_results, pose_results):
+    hand_lm = hand_landmarks_from_results(None, hand_results)
+    face_lm = face_landmarks_from_results(None, face_results)
+    pose_lm = pose_landmarks_from_results(None, pose_results)
+    return combine_landmarks(hand_lm, face_lm, pose_lm)
+
+
+def measure(fn, frames: int):
+    """Return (microseconds per frame, traced bytes allocated per frame at peak)."""
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / frames * 1e6, peak
+
+
+def run(frames: int):
+    out = np.empty(config.NUM_LANDMARKS, dtype=np.float32)
+    for face_points in (478, 468):
+        results = make_fake_results(face_points=face_points)
+        expected = legacy_path(*results)
+        pack_combined_landmarks(*results, out)
+        if not np.array_equal(expected, out):
+            raise SystemExit(f"Packed vector differs from legacy output (face_points={face_points})")
+
+        legacy_us, legacy_bytes = measure(lambda: legacy_path(*results), frames)
+        packed_us, packed_bytes = measure(lambda: pack_combined_landmarks(*results, out), frames)
+
+        print(f"\n=== face mesh with {face_points} points, {frames} frames ===")
+        print(f"  {'path':10s} {'us/frame':>10s} {'peak bytes/frame':>18s}")
+        print(f"  {'legacy':10s} {legacy_us:10.1f} {legacy_bytes:18d}")
+        print(f"  {'packed':10s} {packed_us:10.1f} {packed_bytes:18d}")
+        print(f"  speedup: {legacy_us / packed_us:.2f}x")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark landmark packing paths.")
+    parser.add_argument("--frames", type=int, default=2000, help="Frames to time per path.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.frames)
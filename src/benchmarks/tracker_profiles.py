@@ -0,0 +1,164 @@
+"""
+Benchmark the tracker profiles (fast / balanced / accurate) on the bundled video clips.
+
+For every profile each clip is run through a fresh solutions extractor and
+timed. Accuracy is reported against a reference profile (--reference,
+default "accurate"):
+- person:    fraction of frames where person presence agrees
+- hands:     fraction of frames where per-slot hand presence agrees
+- hand/face/pose err: mean absolute x/y difference (normalized image units)
+                      where both runs found the block
+
+With --model-path (needs TensorFlow and a trained model) the LSTM is also run
+on sliding windows of each clip and the fraction classified as the clip's
+folder label is reported.
+
+The pip package only ships the "full" pose model; MediaPipe downloads the
+lite (fast) and heavy (accurate) ones on first use.
+
+Usage (from project root):
+    python -m src.benchmarks.tracker_profiles --root video_dataset
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src import config
+from src.benchmarks.extractor_backends import load_frames
+from src.utils.extractors import create_extractor
+from src.utils.feature_schema import FeatureSchema, get_schema, load_model_schema
+from src.utils.tracker_profiles import TRACKER_PROFILES
+
+
+def extract_clip(profile: str, frames: List[np.ndarray], schema: FeatureSchema):
+    """Vectors (zeros for no person) and elapsed seconds for one clip."""
+    extractor = create_extractor("solutions", schema=schema, profile=profile, motion_threshold=0.0)
+    try:
+        out = np.zeros((len(frames), schema.num_features), dtype=np.float32)
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            extractor.extract_into(frame, out[i])
+        return out, time.perf_counter() - start
+    finally:
+        extractor.close()
+
+
+def _xy(block: np.ndarray) -> np.ndarray:
+    points = block.reshape(block.shape[0], -1, 3)
+    return points[:, :, :2]
+
+
+def block_error(a: np.ndarray, b: np.ndarray) -> float:
+    """Mean |xy| difference over frames where both blocks are non-zero."""
+    both = np.any(a != 0, axis=1) & np.any(b != 0, axis=1)
+    if not both.any():
+        return float("nan")
+    return float(np.abs(_xy(a[both]) - _xy(b[both])).mean())
+
+
+def compare(vectors: np.ndarray, reference: np.ndarray, schema: FeatureSchema) -> Dict[str, float]:
+    person = np.any(vectors != 0, axis=1)
+    ref_person = np.any(reference != 0, axis=1)
+    row = {"person": float((person == ref_person).mean())}
+    hand_size = schema.hand_size // 2
+    agree, errors = [], []
+    for slot in range(2):
+        offset = schema.hand_offset + slot * hand_size
+        a, b = vectors[:, offset : offset + hand_size], reference[:, offset : offset + hand_size]
+        agree.append(np.any(a != 0, axis=1) == np.any(b != 0, axis=1))
+        errors.append(block_error(a, b))
+    row["hands"] = float(np.mean(agree))
+    row["hand_err"] = float(np.nanmean(errors)) if not np.all(np.isnan(errors)) else float("nan")
+    for name in ("face", "pose"):
+        offset, size = schema.blocks[name]
+        row[f"{name}_err"] = block_error(vectors[:, offset : offset + size], reference[:, offset : offset + size])
+    return row
+
+
+def classification_accuracy(model, vectors: np.ndarray, label_idx: int, stride: int = 10) -> Optional[float]:
+    windows = [
+        vectors[start : start + config.SEQUENCE_LENGTH]
+        for start in range(0, len(vectors) - config.SEQUENCE_LENGTH + 1, stride)
+    ]
+    if not windows:
+        return None
+    probs = model.predict(np.stack(windows), verbose=0)
+    return float((probs.argmax(axis=1) == label_idx).mean())
+
+
+def run(root: Path, profiles: List[str], max_frames: int, model_path: Optional[Path], reference: str = "accurate"):
+    clips = sorted(p for p in root.glob("*/*") if p.is_file())
+    if not clips:
+        raise SystemExit(f"No video clips found under {root}")
+
+    model, label_to_idx = None, {}
+    if model_path is not None:
+        import tensorflow as tf
+
+        from src.utils.data_utils import load_label_map
+
+        model = tf.keras.models.load_model(model_path)
+        label_to_idx = {label: idx for idx, label in load_label_map().items()}
+        schema = load_model_schema(model_path)
+    else:
+        # Fixed offsets make per-block comparison straightforward
+        schema = get_schema("full_v2")
+
+    frames_by_clip = {clip: load_frames(clip.parent, max_frames, pattern=clip.name) for clip in clips}
+    total_frames = sum(len(frames) for frames in frames_by_clip.values())
+    print(f"Loaded {total_frames} frames from {len(clips)} clips under {root} (schema {schema.name})\n")
+
+    names = list(dict.fromkeys([reference] + profiles))
+    vectors: Dict[str, Dict[Path, np.ndarray]] = {name: {} for name in names}
+    elapsed: Dict[str, float] = {name: 0.0 for name in names}
+    for name in names:
+        for clip, frames in frames_by_clip.items():
+            vectors[name][clip], seconds = extract_clip(name, frames, schema)
+            elapsed[name] += seconds
+
+    header = (
+        f"  {'profile':9s} {'fps':>7s} {'ms/frame':>9s} {'person':>7s} {'hands':>6s} "
+        f"{'hand_err':>9s} {'face_err':>9s} {'pose_err':>9s}"
+    )
+    if model is not None:
+        header += f" {'cls_acc':>8s}"
+    print(header)
+    for name in profiles:
+        rows = [compare(vectors[name][clip], vectors[reference][clip], schema) for clip in clips]
+        mean = {key: float(np.nanmean([row[key] for row in rows])) for key in rows[0]}
+        line = (
+            f"  {name:9s} {total_frames / elapsed[name]:7.1f} {elapsed[name] / total_frames * 1000:9.1f} "
+            f"{mean['person']:7.1%} {mean['hands']:6.1%} {mean['hand_err']:9.4f} "
+            f"{mean['face_err']:9.4f} {mean['pose_err']:9.4f}"
+        )
+        if model is not None:
+            scores = [
+                classification_accuracy(model, vectors[name][clip], label_to_idx[clip.parent.name])
+                for clip in clips
+                if clip.parent.name in label_to_idx
+            ]
+            scores = [s for s in scores if s is not None]
+            line += f" {np.mean(scores):8.1%}" if scores else f" {'n/a':>8s}"
+        print(line)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark tracker speed/accuracy profiles.")
+    parser.add_argument("--root", type=str, default="video_dataset", help="Video dataset root folder.")
+    parser.add_argument("--profiles", nargs="+", choices=TRACKER_PROFILES, default=list(TRACKER_PROFILES))
+    parser.add_argument(
+        "--reference", choices=TRACKER_PROFILES, default="accurate", help="Profile to measure accuracy against."
+    )
+    parser.add_argument("--max-frames", type=int, default=150, help="Frames to load per clip.")
+    parser.add_argument("--model-path", type=Path, default=None, help="Also report LSTM accuracy with this model.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(Path(args.root), args.profiles, args.max_frames, args.model_path, args.reference)
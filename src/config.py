@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 # Base paths
@@ -13,10 +14,16 @@ SEQUENCE_LENGTH = 30  # frames per sample
 # Pose (upper body): MediaPipe Pose has 33 landmarks, we use upper body subset (11 key points) = 33
 #   Key points: nose, eyes, ears, shoulders, elbows, wrists, chest region
 # Total: 126 + 1404 + 33 = 1563 features per frame
+# These are the nominal sizes of the legacy_v1 layout; the actual per-frame
+# layout and width come from the feature schema (src/utils/feature_schema.py).
 HAND_LANDMARKS = 2 * 21 * 3  # 126
 FACE_LANDMARKS = 468 * 3  # 1404 (MediaPipe Face Mesh)
 POSE_UPPER_BODY_LANDMARKS = 11 * 3  # 33 (head, shoulders, chest, arms)
 NUM_LANDMARKS = HAND_LANDMARKS + FACE_LANDMARKS + POSE_UPPER_BODY_LANDMARKS  # 1563
+# Feature schema for newly extracted data: "legacy_v1" (matches the bundled
+# dataset), "full_v2" (fixed offsets, 1563) or "compact_v2" (face subset, 459).
+# Trained models and the dataset folder record the schema they were built with.
+FEATURE_SCHEMA = os.environ.get("ISL_FEATURE_SCHEMA", "legacy_v1")
 
 # Data/Model parameters (CNN image model)
 IMAGE_SIZE = 128  # H = W
@@ -30,4 +37,78 @@ EPOCHS = 50
 LEARNING_RATE = 1e-3
 MIN_CONFIDENCE = 0.6  # threshold for predictions in inference
 
+# Extraction pipeline
+# Landmark backend: "solutions" (mp.solutions, synchronous), "tasks"
+# (MediaPipe Tasks LIVE_STREAM, asynchronous; needs the .task bundles below)
+# or "synthetic" (generated landmarks, no camera/MediaPipe; for load tests)
+EXTRACTOR_BACKEND = os.environ.get("ISL_EXTRACTOR_BACKEND", "solutions")
+MEDIAPIPE_TASKS_DIR = MODEL_DIR / "mediapipe"
+HAND_LANDMARKER_TASK = "hand_landmarker.task"
+FACE_LANDMARKER_TASK = "face_landmarker.task"
+POSE_LANDMARKER_TASK = "pose_landmarker_full.task"
+# Simulated per-frame extraction cost of the synthetic backend
+SYNTHETIC_COST_MS = float(os.environ.get("ISL_SYNTHETIC_COST_MS", "30"))
+# Named speed/accuracy profile ("fast", "balanced", "accurate"; see
+# src/utils/tracker_profiles.py). Empty = use the individual settings below.
+TRACKER_PROFILE = os.environ.get("ISL_TRACKER_PROFILE", "")
+# Run pose first and skip hands/face when no person is in frame (server sessions)
+GATE_ON_POSE = True
+# Run hand landmarks on pose-guided crops around each wrist instead of the full frame
+HAND_ROI = False
+# Multi-rate scheduling: run pose / face mesh every N frames and carry their
+# last landmarks in between (hands run every frame). 1 = every frame.
+POSE_EVERY_N_FRAMES = 1
+FACE_EVERY_N_FRAMES = 1
+# Reuse the previous landmarks when a 32x24 grayscale thumbnail changes by less
+# than this mean absolute difference (0-255). 0 disables the motion gate.
+MOTION_THRESHOLD = 0.0
+# Server working resolution: the server decodes JPEGs at a reduced size and
+# shrinks frames so their long side is at most this many pixels before
+# detection (landmarks are normalized, so the output layout is unchanged).
+# Only the server opts in; dataset tools extract at native size. 0 = native.
+WORKING_RESOLUTION = int(os.environ.get("ISL_WORKING_RESOLUTION", "640"))
+# Websocket sessions: extractors in the server's pool (= concurrent sessions),
+# and how long a new session waits for one before being turned away
+SESSION_POOL_SIZE = int(os.environ.get("ISL_SESSION_POOL_SIZE", "4"))
+SESSION_WAIT_TIMEOUT = 5.0  # seconds
+# Executor for the server's CPU-bound stages, so the event loop only does I/O.
+# "thread": decode, extraction and prediction on a thread pool (OpenCV,
+# MediaPipe and TensorFlow release the GIL). "process": frame decode moves to a
+# process pool; extraction and prediction keep their in-process state on threads.
+SERVER_EXECUTOR = os.environ.get("ISL_SERVER_EXECUTOR", "thread")
+SERVER_WORKERS = int(os.environ.get("ISL_SERVER_WORKERS", "0")) or (os.cpu_count() or 4)
+# > 0: sessions' decode + landmark extraction run in this many worker processes
+# (src/utils/extraction_workers.py) instead of the in-process extractor pool;
+# SESSION_POOL_SIZE still caps concurrent sessions. Encoded frames reach the
+# workers through a shared-memory block of EXTRACTION_SHM_BYTES per session.
+EXTRACTION_WORKERS = int(os.environ.get("ISL_EXTRACTION_WORKERS", "0"))
+EXTRACTION_SHM_BYTES = int(os.environ.get("ISL_EXTRACTION_SHM_BYTES", str(8 * 1024 * 1024)))
+# A worker that takes longer than this (seconds) on one request is considered
+# hung (e.g. a native deadlock) and is killed; the next checkout respawns it
+EXTRACTION_WORKER_TIMEOUT = float(os.environ.get("ISL_EXTRACTION_WORKER_TIMEOUT", "10"))
+# Cross-session micro-batching of LSTM predictions: a batch runs once it has
+# BATCH_MAX_SIZE windows or its first window has waited BATCH_MAX_WAIT_MS
+BATCH_MAX_SIZE = int(os.environ.get("ISL_BATCH_MAX_SIZE", "32"))
+BATCH_MAX_WAIT_MS = float(os.environ.get("ISL_BATCH_MAX_WAIT_MS", "5"))
+# A full window is re-predicted once every PREDICTION_HOP new frames; in between,
+# and whenever a frame added nothing (no person), the last result is re-sent
+PREDICTION_HOP = int(os.environ.get("ISL_PREDICTION_HOP", "1"))
+# > 0: live sessions use streaming LSTM inference (src/models/streaming_lstm.py)
+# with this many staggered streams, i.e. an exact window prediction every
+# SEQUENCE_LENGTH / STREAMING_STREAMS frames at O(1) cost per frame. 0 = window model.
+STREAMING_STREAMS = int(os.environ.get("ISL_STREAMING_STREAMS", "0"))
+# Most sequences accepted by one POST /predict/batch request (all run in one model call)
+PREDICT_BATCH_MAX_SEQUENCES = int(os.environ.get("ISL_PREDICT_BATCH_MAX", "256"))
+# Unix socket of a shared model process (python -m src.model_server). When set,
+# server workers send windows there instead of loading TensorFlow and the model.
+MODEL_SERVER_SOCKET = os.environ.get("ISL_MODEL_SERVER", "")
+# How long a server worker waits at startup for the model server to answer
+# before /readyz reports "failed" (seconds)
+MODEL_SERVER_WAIT = float(os.environ.get("ISL_MODEL_SERVER_WAIT", "120"))
+# Record per-stage timings (src/utils/profiling.py); can also be toggled at runtime
+PROFILE_PIPELINE = os.environ.get("ISL_PROFILE", "0") == "1"
+# GET /metrics (Prometheus) on the servers. Its latency histograms are the stage
+# timings above, so the servers switch them on unless ISL_METRICS=0.
+METRICS_ENABLED = os.environ.get("ISL_METRICS", "1") == "1"
+
 
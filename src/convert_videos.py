@@ -33,16 +33,13 @@ import numpy as np
 
 from src import config
 from src.utils.data_utils import get_sample_counts, save_sequence
-from src.utils.mediapipe_utils import (
-    create_hand_tracker,
-    create_face_tracker,
-    create_pose_tracker,
-    extract_combined_landmarks,
-)
+from src.utils.extractors import Extractor, create_extractor
+from src.utils.feature_schema import ensure_dataset_schema, get_schema
+from src.utils.tracker_profiles import TRACKER_PROFILES
 
 
 def extract_landmarks_from_video(
-    video_path: Path, hands, face_mesh, pose, stride: int = 10
+    video_path: Path, extractor: Extractor, stride: int = 10
 ) -> list[np.ndarray]:
     
     cap = cv2.VideoCapture(str(video_path))
@@ -60,7 +57,7 @@ def extract_landmarks_from_video(
                 break
 
             # Extract  landmarks 
-            landmarks = extract_combined_landmarks(frame, hands, face_mesh, pose, draw=False)
+            landmarks = extractor.extract(frame, draw=False)
             if landmarks is not None:
                 all_landmarks.append(landmarks)
             frame_count += 1
@@ -73,23 +70,23 @@ def extract_landmarks_from_video(
 
 
 def create_sequences_from_landmarks(
-    landmarks_list: list[np.ndarray], stride: int
+    landmarks_list: list[np.ndarray], stride: int, num_features: int = config.NUM_LANDMARKS
 ) -> list[np.ndarray]:
    
     
     normalized_list = []
     for lm in landmarks_list:
         if lm is None:
-            normalized_list.append(np.zeros(config.NUM_LANDMARKS, dtype=np.float32))
-        elif lm.shape[0] != config.NUM_LANDMARKS:
+            normalized_list.append(np.zeros(num_features, dtype=np.float32))
+        elif lm.shape[0] != num_features:
             # Pad or truncate to correct size
-            if lm.shape[0] < config.NUM_LANDMARKS:
+            if lm.shape[0] < num_features:
                 # Pad with zeros
-                pad_size = config.NUM_LANDMARKS - lm.shape[0]
+                pad_size = num_features - lm.shape[0]
                 lm = np.concatenate([lm, np.zeros(pad_size, dtype=np.float32)])
             else:
                 # Truncate
-                lm = lm[:config.NUM_LANDMARKS]
+                lm = lm[:num_features]
             normalized_list.append(lm)
         else:
             normalized_list.append(lm)
@@ -98,7 +95,7 @@ def create_sequences_from_landmarks(
         # Video too short: pad with zeros
         print(f"  [WARN] Video has only {len(normalized_list)} frames, padding to {config.SEQUENCE_LENGTH}")
         while len(normalized_list) < config.SEQUENCE_LENGTH:
-            normalized_list.append(np.zeros(config.NUM_LANDMARKS, dtype=np.float32))
+            normalized_list.append(np.zeros(num_features, dtype=np.float32))
 
     sequences = []
     # Slide window across the video
@@ -107,26 +104,37 @@ def create_sequences_from_landmarks(
         # Ensure all arrays in seq have the same shape before stacking
         seq_arrays = []
         for arr in seq:
-            if arr.shape[0] != config.NUM_LANDMARKS:
-                if arr.shape[0] < config.NUM_LANDMARKS:
-                    arr = np.concatenate([arr, np.zeros(config.NUM_LANDMARKS - arr.shape[0], dtype=np.float32)])
+            if arr.shape[0] != num_features:
+                if arr.shape[0] < num_features:
+                    arr = np.concatenate([arr, np.zeros(num_features - arr.shape[0], dtype=np.float32)])
                 else:
-                    arr = arr[:config.NUM_LANDMARKS]
+                    arr = arr[:num_features]
             seq_arrays.append(arr)
         sequences.append(np.stack(seq_arrays))
 
     return sequences
 
 
-def convert_video_dataset(root: Path, stride: int = 10):
+def convert_video_dataset(
+    root: Path,
+    stride: int = 10,
+    motion_threshold: float = config.MOTION_THRESHOLD,
+    tracker_profile: str = config.TRACKER_PROFILE,
+):
    
     if not root.exists():
         raise SystemExit(f"Video dataset root not found: {root}")
 
+    schema = get_schema()
+    ensure_dataset_schema(schema)
     counts = get_sample_counts()
-    hands = create_hand_tracker(static_image_mode=False, max_num_hands=2)
-    face_mesh = create_face_tracker(static_image_mode=False)
-    pose = create_pose_tracker(static_image_mode=False)
+    extractor = create_extractor(
+        static_image_mode=False,
+        max_num_hands=2,
+        schema=schema,
+        profile=tracker_profile,
+        motion_threshold=motion_threshold,
+    )
 
     try:
         for label_dir in sorted(root.glob("*")):
@@ -155,13 +163,13 @@ def convert_video_dataset(root: Path, stride: int = 10):
                 print(f"  Processing: {video_path.name}")
 
                 # Extract landmarks from all frames
-                landmarks_list = extract_landmarks_from_video(video_path, hands, face_mesh, pose, stride)
+                landmarks_list = extract_landmarks_from_video(video_path, extractor, stride)
                 if not landmarks_list:
                     print(f"  [WARN] No landmarks extracted from {video_path.name}, skipping")
                     continue
 
                 # Create sequences using sliding window
-                sequences = create_sequences_from_landmarks(landmarks_list, stride)
+                sequences = create_sequences_from_landmarks(landmarks_list, stride, schema.num_features)
                 print(f"  Created {len(sequences)} sequences from this video")
 
                 # Save each sequence
@@ -174,9 +182,9 @@ def convert_video_dataset(root: Path, stride: int = 10):
                 print(f"  Saved sequences {label}_{existing:04d} to {label}_{idx-1:04d}")
 
     finally:
-        hands.close()
-        face_mesh.close()
-        pose.close()
+        if "reuse_ratio" in extractor.stats():
+            print(f"\nMotion gate reused {extractor.stats()['reuse_ratio']:.1%} of frames")
+        extractor.close()
 
 
 def parse_args():
@@ -195,10 +203,27 @@ def parse_args():
         default=10,
         help="Step size for sliding window (lower = more overlap, more sequences). Default: 10",
     )
+    parser.add_argument(
+        "--motion-threshold",
+        type=float,
+        default=config.MOTION_THRESHOLD,
+        help="Reuse previous landmarks for near-static frames below this thumbnail difference (0 = off).",
+    )
+    parser.add_argument(
+        "--tracker-profile",
+        choices=TRACKER_PROFILES,
+        default=config.TRACKER_PROFILE or None,
+        help="Speed/accuracy profile of the landmark trackers (fast, balanced, accurate).",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    convert_video_dataset(Path(args.root), stride=args.stride)
+    convert_video_dataset(
+        Path(args.root),
+        stride=args.stride,
+        motion_threshold=args.motion_threshold,
+        tracker_profile=args.tracker_profile,
+    )
 
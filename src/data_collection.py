@@ -16,21 +16,17 @@ import numpy as np
 
 from src import config
 from src.utils.data_utils import save_sequence, get_sample_counts
-from src.utils.mediapipe_utils import (
-    create_hand_tracker,
-    create_face_tracker,
-    create_pose_tracker,
-    extract_combined_landmarks,
-    draw_info,
-)
+from src.utils.extractors import create_extractor
+from src.utils.feature_schema import ensure_dataset_schema, get_schema
+from src.utils.mediapipe_utils import draw_info
 
 
 def collect_gesture(labels: List[str], samples_per_label: int):
+    schema = get_schema()
+    ensure_dataset_schema(schema)
     counts = get_sample_counts()
     # Track hands, face, AND upper body pose (chest, head, shoulders) for complete ISL signs
-    hands = create_hand_tracker(static_image_mode=False, max_num_hands=2)
-    face_mesh = create_face_tracker(static_image_mode=False)
-    pose = create_pose_tracker(static_image_mode=False)
+    extractor = create_extractor(static_image_mode=False, max_num_hands=2, schema=schema)
 
     cap = cv2.VideoCapture(0)
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
@@ -58,7 +54,7 @@ def collect_gesture(labels: List[str], samples_per_label: int):
                         continue
 
                     # Extract combined hand + face + pose (chest, head, upper body) landmarks
-                    landmarks = extract_combined_landmarks(frame, hands, face_mesh, pose, draw=True)
+                    landmarks = extractor.extract(frame, draw=True)
                     if landmarks is not None:
                         sequence.append(landmarks)
                         draw_info(
@@ -76,9 +72,7 @@ def collect_gesture(labels: List[str], samples_per_label: int):
                 print(f"Saved {path}")
     finally:
         cap.release()
-        hands.close()
-        face_mesh.close()
-        pose.close()
+        extractor.close()
         cv2.destroyAllWindows()
 
 
@@ -15,14 +15,13 @@ import numpy as np
 import tensorflow as tf
 
 from src import config
+from src.models.streaming_lstm import StreamingLSTM
 from src.utils.data_utils import load_label_map
-from src.utils.mediapipe_utils import (
-    create_hand_tracker,
-    create_face_tracker,
-    create_pose_tracker,
-    extract_combined_landmarks,
-    draw_info,
-)
+from src.utils.extractors import EXTRACTOR_BACKENDS, create_extractor
+from src.utils.feature_schema import load_model_schema
+from src.utils.mediapipe_utils import draw_info
+from src.utils.profiling import PROFILER
+from src.utils.tracker_profiles import TRACKER_PROFILES
 
 
 def smooth_prediction(probs: np.ndarray, history: Deque[int], threshold: float):
@@ -48,31 +47,68 @@ def smooth_prediction(probs: np.ndarray, history: Deque[int], threshold: float):
     return pred_idx, confidence
 
 
-def run(model_path: str, threshold: float):
+def draw_profile(frame: np.ndarray):
+    """Per-stage timings in the bottom-left corner."""
+    lines = PROFILER.summary_lines() or ["profiling: waiting for frames"]
+    y = frame.shape[0] - 10 - 18 * (len(lines) - 1)
+    for line in lines:
+        cv2.putText(frame, line, (10, y), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 255, 0), 1)
+        y += 18
+
+
+def run(
+    model_path: str,
+    threshold: float,
+    backend: str = config.EXTRACTOR_BACKEND,
+    profile: bool = False,
+    tracker_profile: str = config.TRACKER_PROFILE,
+    streams: int = config.STREAMING_STREAMS,
+):
     label_map = load_label_map()
     model = tf.keras.models.load_model(model_path)
     cap = cv2.VideoCapture(0)
     # Track hands, face, AND upper body pose (chest, head, shoulders) for complete ISL signs
-    hands = create_hand_tracker(static_image_mode=False, max_num_hands=2)
-    face_mesh = create_face_tracker(static_image_mode=False)
-    pose = create_pose_tracker(static_image_mode=False)
+    extractor = create_extractor(
+        backend,
+        static_image_mode=False,
+        max_num_hands=2,
+        schema=load_model_schema(model_path),
+        profile=tracker_profile,
+    )
     buffer: Deque[np.ndarray] = collections.deque(maxlen=config.SEQUENCE_LENGTH)
+    # streams > 0: step the LSTM one frame at a time instead of re-running the window
+    stream = StreamingLSTM.from_keras(model).stream(streams) if streams else None
+    probs = None
     history: Deque[int] = collections.deque(maxlen=5)
+    PROFILER.enabled = profile or PROFILER.enabled
 
     try:
         while True:
-            ret, frame = cap.read()
+            with PROFILER.stage("capture"):
+                ret, frame = cap.read()
             if not ret:
                 break
 
             # Extract combined hand + face + pose (chest, head, upper body) landmarks
-            landmarks = extract_combined_landmarks(frame, hands, face_mesh, pose, draw=True)
-            if landmarks is not None:
-                buffer.append(landmarks)
-            if len(buffer) == config.SEQUENCE_LENGTH:
-                input_seq = np.expand_dims(np.array(buffer), axis=0)
-                probs = model.predict(input_seq, verbose=0)[0]
-                pred_idx, conf = smooth_prediction(probs, history, threshold)
+            # With the tasks backend this returns immediately and results arrive a frame or two later
+            extractor.submit(frame, draw=True)
+            vectors = [landmarks for landmarks in extractor.poll() if landmarks is not None]
+            if stream is not None:
+                with PROFILER.stage("predict"):
+                    latest = stream.push_many(vectors)
+                if latest is not None:
+                    probs = latest
+                    pred_idx, conf = smooth_prediction(probs, history, threshold)
+                collected = min(stream.frames, config.SEQUENCE_LENGTH)
+            else:
+                buffer.extend(vectors)
+                if len(buffer) == config.SEQUENCE_LENGTH:
+                    with PROFILER.stage("predict"):
+                        input_seq = np.expand_dims(np.array(buffer), axis=0)
+                        probs = model.predict(input_seq, verbose=0)[0]
+                    pred_idx, conf = smooth_prediction(probs, history, threshold)
+                collected = len(buffer)
+            if probs is not None:
                 pred_label = label_map.get(pred_idx, "unknown")
                 
                 # Show top 3 predictions for debugging
@@ -90,16 +126,21 @@ def run(model_path: str, threshold: float):
                 debug_text = f"Top3: {top3_labels[0]}({top3_probs[0]:.2f}) {top3_labels[1]}({top3_probs[1]:.2f}) {top3_labels[2]}({top3_probs[2]:.2f})"
                 cv2.putText(frame, debug_text, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
             else:
-                draw_info(frame, f"Collecting frames... ({len(buffer)}/{config.SEQUENCE_LENGTH})")
+                draw_info(frame, f"Collecting frames... ({collected}/{config.SEQUENCE_LENGTH})")
 
+            if PROFILER.enabled:
+                draw_profile(frame)
             cv2.imshow("ISL Inference", frame)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord("q"):
                 break
+            if key == ord("p"):
+                # Toggle stage timing; start from a clean slate each time it is switched on
+                PROFILER.enabled = not PROFILER.enabled
+                PROFILER.reset()
     finally:
         cap.release()
-        hands.close()
-        face_mesh.close()
-        pose.close()
+        extractor.close()
         cv2.destroyAllWindows()
 
 
@@ -109,11 +150,29 @@ def parse_args():
     parser.add_argument(
         "--threshold", type=float, default=config.MIN_CONFIDENCE, help="Confidence threshold"
     )
+    parser.add_argument(
+        "--backend", choices=EXTRACTOR_BACKENDS, default=config.EXTRACTOR_BACKEND, help="Landmark extractor backend"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="Show per-stage timings on screen (toggle with 'p')"
+    )
+    parser.add_argument(
+        "--tracker-profile",
+        choices=TRACKER_PROFILES,
+        default=config.TRACKER_PROFILE or None,
+        help="Speed/accuracy profile of the landmark trackers",
+    )
+    parser.add_argument(
+        "--streams",
+        type=int,
+        default=config.STREAMING_STREAMS,
+        help=f"Streaming LSTM inference with this many staggered streams (1-{config.SEQUENCE_LENGTH}, 0 = window model)",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    run(args.model_path, args.threshold)
+    run(args.model_path, args.threshold, args.backend, args.profile, args.tracker_profile, args.streams)
 
 
@@ -0,0 +1,108 @@
+"""
+Serve the LSTM model to every uvicorn worker from one process.
+
+Each web worker started with ISL_MODEL_SERVER=<socket> sends its windows here
+(see src/utils/model_client.py for the wire format) instead of loading
+TensorFlow and the model itself. Windows from all connections go through one
+BatchScheduler, so concurrent workers' requests share batched model calls.
+
+Usage:
+    python -m src.model_server --socket /tmp/isl-model.sock
+    ISL_MODEL_SERVER=/tmp/isl-model.sock uvicorn src.server:app --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from src import config
+from src.utils.batch_scheduler import BatchScheduler
+from src.utils.feature_schema import load_model_schema
+from src.utils.model_client import ERROR, MAX_WINDOWS, REPLY, REQUEST
+
+
+def _error(message: str) -> bytes:
+    data = message.encode("utf-8")
+    return REPLY.pack(ERROR, len(data)) + data
+
+
+async def serve(socket_path: str, model_path: Path):
+    import tensorflow as tf
+
+    from src.models.lstm_classifier import compile_predict
+
+    num_features = load_model_schema(model_path).num_features
+    predict = compile_predict(tf.keras.models.load_model(model_path), num_features)
+    # Trace the graph now rather than on the first request
+    predict(np.zeros((1, config.SEQUENCE_LENGTH, num_features), dtype=np.float32))
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="isl-model")
+    scheduler = BatchScheduler(predict, executor=executor)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                windows, timesteps, features = REQUEST.unpack(await reader.readexactly(REQUEST.size))
+                if not 0 < windows <= MAX_WINDOWS or (timesteps, features) != (config.SEQUENCE_LENGTH, num_features):
+                    writer.write(
+                        _error(
+                            f"Expected 1-{MAX_WINDOWS} windows of ({config.SEQUENCE_LENGTH}, {num_features}), "
+                            f"got ({windows}, {timesteps}, {features})"
+                        )
+                    )
+                    # The payload can't be trusted to be framed as announced
+                    break
+                data = await reader.readexactly(windows * timesteps * features * 4)
+                batch = np.frombuffer(data, dtype="<f4").reshape(windows, timesteps, features)
+                try:
+                    probs = np.stack(await asyncio.gather(*(scheduler.predict(window) for window in batch)))
+                except Exception as exc:
+                    writer.write(_error(f"{type(exc).__name__}: {exc}"))
+                else:
+                    probs = probs.astype("<f4", copy=False)
+                    writer.write(REPLY.pack(*probs.shape))
+                    writer.write(probs.tobytes())
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # client went away
+        finally:
+            writer.close()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)  # stale socket from a previous run
+    server = await asyncio.start_unix_server(handle, path=socket_path)
+    print(f"Serving {model_path} ({num_features} features) on {socket_path}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        scheduler.close()
+        executor.shutdown(wait=False)
+        stats = scheduler.stats()
+        print(f"Served {stats['windows']} windows in {stats['batches']} batches (mean {stats['mean_batch_size']:.1f})")
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serve the ISL model to server workers over a Unix socket.")
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=config.MODEL_SERVER_SOCKET or "/tmp/isl-model.sock",
+        help="Unix socket path to listen on (web workers: ISL_MODEL_SERVER).",
+    )
+    parser.add_argument("--model-path", type=Path, default=config.MODEL_DIR / "isl_lstm.h5")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        asyncio.run(serve(args.socket, args.model_path))
+    except KeyboardInterrupt:
+        pass
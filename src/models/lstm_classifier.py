@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+from typing import Callable
+
+import numpy as np
 import tensorflow as tf
 from tensorflow.keras import layers, models
 
 from src import config
 
 
-def build_model(num_classes: int) -> tf.keras.Model:
+def build_model(num_classes: int, num_features: int = config.NUM_LANDMARKS) -> tf.keras.Model:
     model = models.Sequential(
         [
-            layers.Input(shape=(config.SEQUENCE_LENGTH, config.NUM_LANDMARKS)),
+            layers.Input(shape=(config.SEQUENCE_LENGTH, num_features)),
             layers.Masking(mask_value=0.0),
             layers.LSTM(128, return_sequences=True),
             layers.Dropout(0.3),
@@ -29,3 +32,17 @@ def build_model(num_classes: int) -> tf.keras.Model:
     return model
 
 
+def compile_predict(model: tf.keras.Model, num_features: int) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Predict function for (batch, SEQUENCE_LENGTH, num_features) float32 windows,
+    traced once for every batch size (model.predict re-dispatches per call).
+    """
+    graph = tf.function(
+        lambda windows: model(windows, training=False),
+        input_signature=[tf.TensorSpec([None, config.SEQUENCE_LENGTH, num_features], tf.float32)],
+    )
+
+    def predict(windows: np.ndarray) -> np.ndarray:
+        return graph(windows.astype(np.float32, copy=False)).numpy()
+
+    return predict
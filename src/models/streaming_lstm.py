@@ -0,0 +1,200 @@
+"""
+Streaming inference for the LSTM classifier: one frame in, O(1) work.
+
+Predicting a sliding window re-runs both LSTM layers over all
+SEQUENCE_LENGTH frames, although only the newest frame is new. Here the
+trained weights are run step by step in NumPy, carrying (h, c) between
+frames, so each frame costs one LSTM step per stream.
+
+An LSTM that never resets would see an unbounded history, not the fixed
+window the model was trained on. To keep the model's window semantics a
+stream resets after SEQUENCE_LENGTH frames. Its output at that point is
+exactly the model's prediction for those frames. With `streams` = k, the k
+streams are staggered by SEQUENCE_LENGTH / k frames, so a full-window
+prediction is ready every SEQUENCE_LENGTH / k frames:
+
+    streams = 1                  predict every 30 frames, 1 step/frame
+    streams = SEQUENCE_LENGTH    predict every frame, same output as the
+                                 window model, 30 steps/frame
+
+The first layer's input projection dominates the cost (features x 4*units).
+It is computed once per frame and shared by all streams, so even
+streams = SEQUENCE_LENGTH is much cheaper than re-running the window.
+
+Frames that are all mask_value are skipped, as the Masking layer does, and
+do not count towards a window.
+
+    streaming = StreamingLSTM.from_keras(model)   # shared, read-only
+    stream = streaming.stream(streams=3)          # per session
+    probs = stream.push(vector)                   # None until a window completes
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src import config
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 0.5 * (np.tanh(0.5 * x) + 1.0)
+
+
+def _relu(x: np.ndarray) -> np.ndarray:
+    return np.maximum(x, 0.0)
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    e = np.exp(x - x.max(axis=-1, keepdims=True))
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+_ACTIVATIONS = {"sigmoid": _sigmoid, "tanh": np.tanh, "relu": _relu, "softmax": _softmax, "linear": lambda x: x}
+
+
+def _activation(name: str):
+    if name not in _ACTIVATIONS:
+        raise ValueError(f"Unsupported activation for streaming inference: {name!r}")
+    return _ACTIVATIONS[name]
+
+
+class _LSTMLayer:
+    """Keras LSTM weights; gates are laid out [input, forget, cell, output] along the last axis."""
+
+    def __init__(self, kernel, recurrent_kernel, bias, activation: str = "tanh", recurrent_activation: str = "sigmoid"):
+        self.kernel = np.asarray(kernel, dtype=np.float32)
+        self.recurrent_kernel = np.asarray(recurrent_kernel, dtype=np.float32)
+        self.bias = np.zeros(self.kernel.shape[1], np.float32) if bias is None else np.asarray(bias, np.float32)
+        self.units = self.recurrent_kernel.shape[0]
+        self.activation = _activation(activation)
+        self.recurrent_activation = _activation(recurrent_activation)
+
+    def step(self, projected: np.ndarray, h: np.ndarray, c: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """One timestep for every stream; `projected` is x @ kernel + bias (shared or per stream)."""
+        z = projected + h @ self.recurrent_kernel
+        u = self.units
+        i = self.recurrent_activation(z[:, :u])
+        f = self.recurrent_activation(z[:, u : 2 * u])
+        g = self.activation(z[:, 2 * u : 3 * u])
+        o = self.recurrent_activation(z[:, 3 * u :])
+        c = f * c + i * g
+        return o * self.activation(c), c
+
+
+class StreamingLSTM:
+    """Read-only weights of a Masking -> LSTM... -> Dense... classifier (see lstm_classifier.build_model)."""
+
+    def __init__(
+        self,
+        lstm_layers: List[_LSTMLayer],
+        dense_layers: List[Tuple[np.ndarray, np.ndarray, str]],
+        mask_value: Optional[float] = 0.0,
+        sequence_length: int = config.SEQUENCE_LENGTH,
+    ):
+        if not lstm_layers:
+            raise ValueError("Streaming inference needs at least one LSTM layer")
+        self.lstm_layers = lstm_layers
+        self.dense_layers = [(np.asarray(w, np.float32), np.asarray(b, np.float32), _activation(a)) for w, b, a in dense_layers]
+        self.mask_value = mask_value
+        self.sequence_length = sequence_length
+        self.num_features = lstm_layers[0].kernel.shape[0]
+
+    @classmethod
+    def from_keras(cls, model, sequence_length: int = config.SEQUENCE_LENGTH) -> "StreamingLSTM":
+        """Copy the weights out of a trained Sequential model; raises ValueError for layers it can't stream."""
+        lstm_layers, dense_layers, mask_value = [], [], None
+        for layer in model.layers:
+            kind, cfg = type(layer).__name__, layer.get_config()
+            if kind == "Masking":
+                mask_value = cfg["mask_value"]
+            elif kind == "Dropout":
+                continue
+            elif kind == "LSTM":
+                if dense_layers:
+                    raise ValueError("LSTM layers must come before the Dense head")
+                weights = layer.get_weights()
+                lstm_layers.append(
+                    _LSTMLayer(
+                        weights[0],
+                        weights[1],
+                        weights[2] if cfg.get("use_bias", True) else None,
+                        cfg.get("activation", "tanh"),
+                        cfg.get("recurrent_activation", "sigmoid"),
+                    )
+                )
+            elif kind == "Dense":
+                weights = layer.get_weights()
+                bias = weights[1] if cfg.get("use_bias", True) else np.zeros(weights[0].shape[1], np.float32)
+                dense_layers.append((weights[0], bias, cfg.get("activation", "linear")))
+            else:
+                raise ValueError(f"Unsupported layer for streaming inference: {kind} ({layer.name})")
+        return cls(lstm_layers, dense_layers, mask_value, sequence_length)
+
+    def head(self, h: np.ndarray) -> np.ndarray:
+        for weights, bias, activation in self.dense_layers:
+            h = activation(h @ weights + bias)
+        return h
+
+    def stream(self, streams: int = 1) -> "LSTMStream":
+        return LSTMStream(self, streams)
+
+
+class LSTMStream:
+    """Per-session recurrent state of `streams` staggered window streams."""
+
+    def __init__(self, model: StreamingLSTM, streams: int = 1):
+        if not 1 <= streams <= model.sequence_length:
+            raise ValueError(f"streams must be between 1 and {model.sequence_length}, got {streams}")
+        self.model = model
+        self.streams = streams
+        length = model.sequence_length
+        # Stream j starts after offsets[j] frames, then completes a window every `length` frames
+        self._offsets = np.array([j * length // streams for j in range(streams)])
+        self.reset()
+
+    def reset(self):
+        self._h = [np.zeros((self.streams, layer.units), np.float32) for layer in self.model.lstm_layers]
+        self._c = [np.zeros_like(h) for h in self._h]
+        self._counts = -self._offsets.copy()
+        self.frames = 0
+
+    def push(self, vector: np.ndarray) -> Optional[np.ndarray]:
+        """Consume one frame; class probabilities when a stream completed a window, else None."""
+        model = self.model
+        vector = np.asarray(vector, dtype=np.float32)
+        if model.mask_value is not None and np.all(vector == model.mask_value):
+            return None
+        self.frames += 1
+        active = (self._counts >= 0)[:, None]
+        first = model.lstm_layers[0]
+        # Same input for every stream: project it once
+        x = (vector @ first.kernel + first.bias)[None, :]
+        for n, layer in enumerate(model.lstm_layers):
+            if n:
+                x = x @ layer.kernel + layer.bias
+            h, c = layer.step(x, self._h[n], self._c[n])
+            self._h[n] = np.where(active, h, self._h[n])
+            self._c[n] = np.where(active, c, self._c[n])
+            x = self._h[n]
+        self._counts += 1
+
+        done = np.flatnonzero(self._counts == model.sequence_length)
+        if not len(done):
+            return None
+        j = done[0]
+        probs = model.head(self._h[-1][j : j + 1])[0]
+        for h, c in zip(self._h, self._c):
+            h[j] = 0.0
+            c[j] = 0.0
+        self._counts[j] = 0
+        return probs
+
+    def push_many(self, vectors: Iterable[np.ndarray]) -> Optional[np.ndarray]:
+        """push() each vector; the last probabilities produced, or None."""
+        probs = None
+        for vector in vectors:
+            out = self.push(vector)
+            if out is not None:
+                probs = out
+        return probs
@@ -1,33 +1,61 @@
 """
 FastAPI backend for ISL recognition.
 
+The app answers HTTP as soon as it is imported; the model and the landmark
+extractors load and warm up in the background. GET /healthz reports the
+process is up, GET /readyz turns 200 once recognition is available (503
+before), and until then the model-backed endpoints answer 503 and websockets
+close with 1013 (try again later).
+
 Run:
     uvicorn src.server:app --reload --port 8000
 """
 from __future__ import annotations
 
-import base64
-import json
+import asyncio
 import collections
+import functools
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Deque, List
+from dataclasses import asdict
+from typing import Awaitable, Callable, List, Optional, Union
 
-import cv2
 import numpy as np
-import tensorflow as tf
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from pydantic import BaseModel
 
 from src import config
+from src.models.streaming_lstm import LSTMStream, StreamingLSTM
+from src.utils.batch_scheduler import BATCH_SIZE_BOUNDS, BatchScheduler
 from src.utils.data_utils import load_label_map
-from src.utils.mediapipe_utils import (
-    create_hand_tracker,
-    create_face_tracker,
-    create_pose_tracker,
-    extract_combined_landmarks,
+from src.utils.extraction_workers import ExtractionWorkers, WorkerError, WorkerSession
+from src.utils.extractor_pool import ExtractorPool, PoolExhausted
+from src.utils.extractors import Extractor, create_extractor
+from src.utils.feature_schema import load_model_schema
+from src.utils.frame_slot import FrameSlot
+from src.utils.image_utils import decode_payload
+from src.utils.metrics import CONTENT_TYPE, MetricsText, executor_queue_depth
+from src.utils.model_client import ModelClient
+from src.utils.profiling import PROFILER, Histogram
+from src.utils.sequence_payload import PayloadError, max_body_bytes, parse_sequences, top_k_classes
+from src.utils.sequence_window import SequenceWindow
+from src.utils.tracker_profiles import PROFILES
+from src.utils.ws_protocol import (
+    KIND_JPEG,
+    NO_LABEL,
+    FrameHeader,
+    ProtocolError,
+    pack_reply,
+    parse_frame,
+    unpack_landmarks,
 )
 
 # Get the frontend directory path
@@ -49,16 +77,220 @@ TEXT_TO_SIGN_DIR = config.PROJECT_ROOT / "text_to_sign"
 if TEXT_TO_SIGN_DIR.exists():
     app.mount("/static/text_to_sign", StaticFiles(directory=str(TEXT_TO_SIGN_DIR)), name="text_to_sign_static")
 
-model = tf.keras.models.load_model(config.MODEL_DIR / "isl_lstm.h5")
+# GET /metrics reports the stage timings, so record them unless metrics are off
+if config.METRICS_ENABLED:
+    PROFILER.enabled = True
+
+MODEL_PATH = config.MODEL_DIR / "isl_lstm.h5"
 label_map = load_label_map()
+# Extract exactly the layout the model was trained on (legacy_v1 if it predates schemas)
+schema = load_model_schema(MODEL_PATH)
 # Track hands, face, AND upper body pose (chest, head, shoulders) for complete ISL signs
-hands = create_hand_tracker(static_image_mode=False, max_num_hands=2)
-face_mesh = create_face_tracker(static_image_mode=False)
-pose = create_pose_tracker(static_image_mode=False)
+# Backend comes from config.EXTRACTOR_BACKEND (ISL_EXTRACTOR_BACKEND=synthetic for camera-less load tests)
+# Trackers keep per-stream state, so every websocket session checks out its own
+# extractor from a bounded pool (pre-warmed for config.TRACKER_PROFILE)
+def build_extractor(profile: Optional[str] = None) -> Extractor:
+    return create_extractor(
+        static_image_mode=False,
+        max_num_hands=2,
+        schema=schema,
+        profile=profile,
+        working_resolution=config.WORKING_RESOLUTION,
+    )
+
+
+# Built and warmed up in the background at startup (init_extractors)
+session_pool: Optional[Union[ExtractorPool, ExtractionWorkers]] = None
+
+# CPU-bound stages never run on the event loop. Each session awaits one frame
+# before reading the next, so per-session order holds with any executor.
+cpu_executor = ThreadPoolExecutor(max_workers=config.SERVER_WORKERS, thread_name_prefix="isl-cpu")
+decode_executor: Executor = cpu_executor
+if config.SERVER_EXECUTOR == "process":
+    # spawn: children only import image_utils, not TensorFlow / MediaPipe
+    decode_executor = ProcessPoolExecutor(
+        max_workers=config.SERVER_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+elif config.SERVER_EXECUTOR != "thread":
+    raise ValueError(f"Unknown ISL_SERVER_EXECUTOR: {config.SERVER_EXECUTOR!r} (expected 'thread' or 'process')")
+
+
+def extract_vectors(extractor: Extractor, frame: np.ndarray) -> List[np.ndarray]:
+    """Feed one frame; return the vectors (person found) that finished meanwhile."""
+    # Extract combined hand + face + pose (chest, head, upper body) landmarks
+    # The tasks backend returns results asynchronously, possibly for earlier frames
+    extractor.submit(frame)
+    return [landmarks for landmarks in extractor.poll() if landmarks is not None]
+
+
+def decode_and_extract(extractor: Extractor, image: Union[bytes, memoryview, str]) -> List[np.ndarray]:
+    with PROFILER.stage("decode"):
+        # JPEGs larger than the working resolution are decoded at 1/2, 1/4 or 1/8 size
+        frame = decode_payload(image, config.WORKING_RESOLUTION)
+    return [] if frame is None else extract_vectors(extractor, frame)
+
+
+async def frame_to_vectors(
+    extractor: Union[Extractor, WorkerSession], image: Union[bytes, memoryview, str]
+) -> List[np.ndarray]:
+    """`image`: raw encoded bytes (binary protocol) or a base64 data URL (JSON protocol)."""
+    if isinstance(extractor, WorkerSession):
+        return await extractor.extract(image)
+    loop = asyncio.get_running_loop()
+    if decode_executor is cpu_executor:
+        return await loop.run_in_executor(cpu_executor, decode_and_extract, extractor, image)
+    if isinstance(image, memoryview):
+        image = image.tobytes()  # crosses the process boundary
+    with PROFILER.stage("decode"):
+        frame = await loop.run_in_executor(decode_executor, decode_payload, image, config.WORKING_RESOLUTION)
+    if frame is None:
+        return []
+    return await loop.run_in_executor(cpu_executor, extract_vectors, extractor, frame)
+
+
+if config.STREAMING_STREAMS and not 1 <= config.STREAMING_STREAMS <= config.SEQUENCE_LENGTH:
+    raise ValueError(f"ISL_STREAMING_STREAMS must be between 0 and {config.SEQUENCE_LENGTH}")
+if config.STREAMING_STREAMS and config.MODEL_SERVER_SOCKET:
+    raise ValueError("ISL_STREAMING_STREAMS needs the model in-process; it can't be combined with ISL_MODEL_SERVER")
+
+# Loaded in the background at startup (init_model)
+model = None
+model_client: Optional[ModelClient] = None
+streaming: Optional[StreamingLSTM] = None
+_predict_windows: Optional[Callable[[np.ndarray], np.ndarray]] = None
+# Every model call (websocket batches, /predict, /predict/batch) by batch size;
+# observed from executor threads, hence the lock
+model_calls = Histogram(BATCH_SIZE_BOUNDS)
+model_calls_lock = threading.Lock()
+
+
+def predict_batch(windows: np.ndarray) -> np.ndarray:
+    """Class probabilities for a (batch, SEQUENCE_LENGTH, features) array of windows."""
+    with PROFILER.stage("predict"):
+        probs = _predict_windows(windows)
+    with model_calls_lock:
+        model_calls.observe(len(windows))
+    return probs
+
+
+# Windows from all sessions are predicted together in micro-batches
+scheduler = BatchScheduler(predict_batch, executor=cpu_executor)
+
+
+def new_stream() -> Optional[LSTMStream]:
+    """With ISL_STREAMING_STREAMS, each session steps its own recurrent state instead."""
+    return streaming.stream(config.STREAMING_STREAMS) if streaming is not None else None
+
+
+# Startup state, reported by /readyz
+readiness = {"model": False, "extractors": False}
+startup_error: Optional[str] = None
+_startup_task: Optional[asyncio.Task] = None
+# Set on shutdown; cancelling _startup_task doesn't stop init_model's thread
+_stopping = threading.Event()
+
+
+def is_ready() -> bool:
+    return all(readiness.values())
+
+
+def init_model():
+    """Load (or connect to) the model and warm it up. Blocking; runs off the event loop."""
+    global model, model_client, streaming, _predict_windows
+    if config.MODEL_SERVER_SOCKET:
+        # One model process shared by all uvicorn workers (python -m src.model_server)
+        model_client = ModelClient(config.MODEL_SERVER_SOCKET)
+        predict = model_client.predict
+        # The model server may still be starting (e.g. restarted alongside us): stay "starting"
+        # until it answers, for at most MODEL_SERVER_WAIT seconds
+        deadline = time.monotonic() + config.MODEL_SERVER_WAIT
+        while True:
+            try:
+                predict(np.zeros((1, config.SEQUENCE_LENGTH, schema.num_features), dtype=np.float32))
+                break
+            except OSError as exc:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Model server at {config.MODEL_SERVER_SOCKET} not answering after "
+                        f"{config.MODEL_SERVER_WAIT:g}s: {exc}"
+                    ) from exc
+                if _stopping.wait(1.0):
+                    raise RuntimeError("Shut down while waiting for the model server") from exc
+    else:
+        import tensorflow as tf
+
+        from src.models.lstm_classifier import compile_predict
+
+        model = tf.keras.models.load_model(MODEL_PATH)
+        # One graph for every batch size: (batch, SEQUENCE_LENGTH, features) -> probabilities
+        predict = compile_predict(model, schema.num_features)
+        if config.STREAMING_STREAMS:
+            streaming = StreamingLSTM.from_keras(model)
+    # Trace the graph (or reach the model server) now, not on the first real request
+    for size in (1, config.BATCH_MAX_SIZE):
+        predict(np.zeros((size, config.SEQUENCE_LENGTH, schema.num_features), dtype=np.float32))
+    _predict_windows = predict
+    readiness["model"] = True
+
+
+async def init_extractors():
+    global session_pool
+    if config.EXTRACTION_WORKERS:
+        # Sessions are pinned to worker processes that own their trackers (ISL_EXTRACTION_WORKERS)
+        session_pool = ExtractionWorkers(
+            config.EXTRACTION_WORKERS,
+            functools.partial(
+                create_extractor,
+                static_image_mode=False,
+                max_num_hands=2,
+                schema=schema,
+                working_resolution=config.WORKING_RESOLUTION,
+            ),
+        )
+        await session_pool.wait_ready()
+    else:
+        session_pool = ExtractorPool(config.SESSION_POOL_SIZE, build_extractor, prebuild=False)
+        await session_pool.fill()
+    readiness["extractors"] = True
+
+
+async def initialize():
+    global startup_error
+    try:
+        await asyncio.gather(asyncio.to_thread(init_model), init_extractors())
+    except Exception as exc:
+        startup_error = f"{type(exc).__name__}: {exc}"
+        logging.getLogger(__name__).exception("Model / extractor initialization failed")
+
+
+def not_ready_response() -> JSONResponse:
+    return JSONResponse({"error": startup_error or "Model is loading, try again shortly"}, status_code=503)
+
+
+@app.on_event("startup")
+async def start_initialization():
+    """Answer HTTP right away; load the model and warm up the extractors in the background."""
+    global _startup_task
+    _startup_task = asyncio.create_task(initialize())
+
+
+@app.on_event("shutdown")
+def shutdown_executors():
+    _stopping.set()
+    if _startup_task is not None:
+        _startup_task.cancel()
+    scheduler.close()
+    if model_client is not None:
+        model_client.close()
+    cpu_executor.shutdown(wait=False, cancel_futures=True)
+    if decode_executor is not cpu_executor:
+        decode_executor.shutdown(wait=False, cancel_futures=True)
+    if session_pool is not None:
+        session_pool.close()
 
 
 class PredictRequest(BaseModel):
-    # Length equals config.NUM_LANDMARKS (hands: 126 + face: 1404 + pose: 33 = 1563)
+    # Length equals schema.num_features (legacy_v1: hands 126 + face 1404 + pose 33 = 1563)
     landmarks: List[float]
 
 
@@ -66,6 +298,11 @@ class TextToSignRequest(BaseModel):
     text: str
 
 
+class ProfileRequest(BaseModel):
+    enabled: bool
+    reset: bool = False
+
+
 @app.get("/")
 async def read_root():
     """Serve the main landing page"""
@@ -98,46 +335,316 @@ def get_labels():
     return {"labels": label_map}
 
 
+@app.get("/schema")
+def get_schema():
+    """Feature layout expected by /predict"""
+    return {**schema.to_dict(), "num_features": schema.num_features, "blocks": schema.blocks}
+
+
+@app.get("/tracker-profiles")
+def get_tracker_profiles():
+    """Profiles selectable per websocket session with /ws?profile=<name>"""
+    return {"default": config.TRACKER_PROFILE or None, "profiles": {n: asdict(p) for n, p in PROFILES.items()}}
+
+
+@app.get("/healthz")
+def get_health():
+    """Liveness: the process serves HTTP (the model may still be loading)"""
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+def get_ready():
+    """Readiness: 200 once the model and extractors are loaded and warmed up, 503 before (or if that failed)"""
+    status = "ready" if is_ready() else ("failed" if startup_error else "starting")
+    body = {"status": status, **readiness}
+    if startup_error:
+        body["error"] = startup_error
+    return JSONResponse(body, status_code=200 if status == "ready" else 503)
+
+
+@app.get("/sessions")
+def get_sessions():
+    """Extractor pool usage, websocket frame counts and prediction batching"""
+    pool = session_pool.stats() if session_pool is not None else {}
+    return {**pool, "frames": dict(frame_totals), "batching": scheduler.stats()}
+
+
+@app.get("/profile")
+def get_profile():
+    """Per-stage timings (ms) of the extraction pipeline and websocket loop"""
+    return {"enabled": PROFILER.enabled, "stages": PROFILER.snapshot()}
+
+
+@app.get("/metrics")
+def get_metrics():
+    """Prometheus scrape endpoint"""
+    text = MetricsText()
+    text.stage_histograms(PROFILER)
+    sessions = [({"endpoint": endpoint}, n) for endpoint, n in active_sessions.items()]
+    text.add("isl_sessions_active", "gauge", "Open websocket sessions", sessions)
+    text.add("isl_ready", "gauge", "1 once the model and extractors are loaded", int(is_ready()))
+    in_use = session_pool.in_use if session_pool is not None else 0
+    text.add("isl_extractors_in_use", "gauge", "Extraction sessions checked out of the pool", in_use)
+    if isinstance(session_pool, ExtractionWorkers):
+        restarts = session_pool.restarts
+        text.add("isl_extraction_worker_restarts_total", "counter", "Dead extraction workers replaced", restarts)
+    text.add("isl_frames_received_total", "counter", "Websocket frames received", frame_totals["received"])
+    text.add("isl_frames_processed_total", "counter", "Websocket frames processed", frame_totals["processed"])
+    text.add("isl_frames_dropped_total", "counter", "Frames superseded before processing", frame_totals["dropped"])
+    text.add("isl_predictions_skipped_total", "counter", "Frames answered with the last result", frame_totals["skipped"])
+    text.add("isl_predictions_total", "counter", "Session predictions (window or streaming)", frame_totals["predicted"])
+    with model_calls_lock:
+        calls = Histogram(BATCH_SIZE_BOUNDS)
+        calls.merge(model_calls)
+    text.add("isl_model_windows_total", "counter", "Windows run through the model (incl. REST)", int(calls.total))
+    text.add("isl_model_batches_total", "counter", "Model calls (websocket batches and REST requests)", calls.count)
+    text.histogram("isl_model_batch_size", "Windows per model call", {"": calls})
+    text.add("isl_batch_queue_depth", "gauge", "Windows waiting for the next batch", scheduler.stats()["queued"])
+    executors = {"cpu": cpu_executor}
+    if decode_executor is not cpu_executor:
+        executors["decode"] = decode_executor
+    depths = [({"executor": name}, executor_queue_depth(executor)) for name, executor in executors.items()]
+    text.add("isl_executor_queue_depth", "gauge", "Tasks waiting for an executor worker", depths)
+    return PlainTextResponse(text.render(), media_type=CONTENT_TYPE)
+
+
+@app.post("/profile")
+def set_profile(req: ProfileRequest):
+    """Switch stage timing on/off at runtime, optionally clearing what was recorded"""
+    PROFILER.enabled = req.enabled
+    if req.reset:
+        PROFILER.reset()
+    return {"enabled": PROFILER.enabled}
+
+
 @app.post("/predict")
 def predict_landmarks(req: PredictRequest):
-    if len(req.landmarks) != config.NUM_LANDMARKS:
-        return {"error": f"Expected {config.NUM_LANDMARKS} values"}
+    if not readiness["model"]:
+        return not_ready_response()
+    if len(req.landmarks) != schema.num_features:
+        return {"error": f"Expected {schema.num_features} values ({schema.name})"}
 
     seq = np.array(req.landmarks, dtype=np.float32)[None, None, :]
     # Pad to full sequence length
     seq = np.tile(seq, (1, config.SEQUENCE_LENGTH, 1))
-    probs = model.predict(seq, verbose=0)[0]
+    probs = predict_batch(seq)[0]
     idx = int(np.argmax(probs))
     return {"label": label_map.get(idx, "unknown"), "confidence": float(np.max(probs))}
 
 
+async def read_body(request: Request, limit: int) -> Optional[bytes]:
+    """The request body, or None as soon as it is known to exceed `limit` bytes."""
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > limit:
+        return None
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@app.post("/predict/batch")
+async def predict_sequences(request: Request, top_k: int = 3):
+    """
+    Many full (SEQUENCE_LENGTH, features) sequences per request as an .npy or
+    msgpack body (see sequence_payload), predicted in one batched model call.
+    Returns the top_k labels of each sequence, in request order.
+    """
+    if not readiness["model"]:
+        return not_ready_response()
+    loop = asyncio.get_running_loop()
+    # Refuse oversized bodies before buffering them
+    limit = max_body_bytes(config.SEQUENCE_LENGTH, schema.num_features, config.PREDICT_BATCH_MAX_SEQUENCES)
+    body = await read_body(request, limit)
+    if body is None:
+        message = f"Body too large for {config.PREDICT_BATCH_MAX_SEQUENCES} sequences ({limit} bytes max)"
+        return JSONResponse({"error": message}, status_code=413)
+    try:
+        windows = await loop.run_in_executor(
+            cpu_executor,
+            parse_sequences,
+            body,
+            request.headers.get("content-type", ""),
+            config.SEQUENCE_LENGTH,
+            schema.num_features,
+            config.PREDICT_BATCH_MAX_SEQUENCES,
+        )
+    except PayloadError as exc:
+        return JSONResponse({"error": str(exc)}, status_code=exc.status)
+    probs = await loop.run_in_executor(cpu_executor, predict_batch, windows)
+    indices, confidences = top_k_classes(probs, top_k)
+    return {
+        "results": [
+            [
+                {"label": label_map.get(int(idx), "unknown"), "index": int(idx), "confidence": float(conf)}
+                for idx, conf in zip(row_idx, row_conf)
+            ]
+            for row_idx, row_conf in zip(indices, confidences)
+        ]
+    }
+
+
+async def advance(window: SequenceWindow, stream: Optional[LSTMStream], vectors: List[np.ndarray]):
+    """Feed a frame's vectors to the session; window.last is then the result to send."""
+    if stream is None:
+        window.extend(vectors)
+        if window.due():
+            window.update(await scheduler.predict(window.array()))
+    elif vectors:
+        loop = asyncio.get_running_loop()
+        probs = await loop.run_in_executor(cpu_executor, PROFILER.timed, "predict", stream.push_many, vectors)
+        if probs is not None:
+            window.update(probs)
+
+
+async def send_result(ws: WebSocket, window: SequenceWindow, header: Optional[FrameHeader]):
+    """Reply in the protocol the frame came in: the latest prediction, or "collecting"."""
+    if window.last is not None:
+        probs = window.last
+        idx = int(np.argmax(probs))
+        conf = float(np.max(probs))
+        with PROFILER.stage("send"):
+            if header is not None:
+                await ws.send_bytes(pack_reply(header, idx, conf))
+            else:
+                await ws.send_json({"label": label_map.get(idx, "unknown"), "confidence": conf})
+    elif header is not None:
+        await ws.send_bytes(pack_reply(header, NO_LABEL))
+    else:
+        await ws.send_json({"label": "collecting", "confidence": 0.0})
+
+
+# Frames received / processed / dropped, and predictions made / skipped, by all websocket sessions
+frame_totals: collections.Counter = collections.Counter()
+active_sessions: collections.Counter = collections.Counter({"/ws": 0, "/ws/landmarks": 0})
+
+
+async def serve_latest(ws: WebSocket, handle: Callable[[dict], Awaitable[bool]], endpoint: str):
+    """
+    Run a websocket session latest-frame-wins (see FrameSlot): a reader task
+    keeps only the newest unprocessed message and `handle` processes them one
+    at a time; it returns False to end the session.
+    """
+    slot = FrameSlot(frame_totals)
+
+    async def read():
+        try:
+            while True:
+                message = await ws.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                slot.put(message)
+        finally:
+            slot.close()
+
+    reader = asyncio.create_task(read())
+    active_sessions[endpoint] += 1
+    try:
+        while True:
+            message = await slot.get()
+            if message is None or not await handle(message):
+                return
+    finally:
+        active_sessions[endpoint] -= 1
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+
+
 @app.websocket("/ws")
 async def websocket_predict(ws: WebSocket):
     await ws.accept()
-    frame_buffer: Deque[np.ndarray] = collections.deque(maxlen=config.SEQUENCE_LENGTH)
+    profile = ws.query_params.get("profile") or None
+    if profile is not None and profile not in PROFILES:
+        await ws.close(code=1008, reason=f"Unknown tracker profile: {profile}")
+        return
+    if not is_ready():
+        await ws.close(code=1013, reason="Server is starting, try again later")
+        return
     try:
-        while True:
-            data = await ws.receive_text()
-            payload = json.loads(data)
-            image_b64 = payload.get("image")
-            if not image_b64:
-                continue
-            img_bytes = base64.b64decode(image_b64.split(",")[-1])
-            image_array = np.frombuffer(img_bytes, dtype=np.uint8)
-            frame = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-            # Extract combined hand + face + pose (chest, head, upper body) landmarks
-            landmarks = extract_combined_landmarks(frame, hands, face_mesh, pose)
-            if landmarks is not None:
-                frame_buffer.append(landmarks)
-
-            if len(frame_buffer) == config.SEQUENCE_LENGTH:
-                seq = np.expand_dims(np.array(frame_buffer), axis=0)
-                probs = model.predict(seq, verbose=0)[0]
-                idx = int(np.argmax(probs))
-                conf = float(np.max(probs))
-                await ws.send_json({"label": label_map.get(idx, "unknown"), "confidence": conf})
+        extractor = await session_pool.checkout(profile, timeout=config.SESSION_WAIT_TIMEOUT)
+    except PoolExhausted:
+        await ws.close(code=1013, reason="Server busy, try again later")
+        return
+    window, stream = SequenceWindow(totals=frame_totals), new_stream()
+
+    async def handle(message: dict) -> bool:
+        # Binary messages: ws_protocol header + raw JPEG; text messages: legacy JSON
+        header: Optional[FrameHeader] = None
+        try:
+            if message.get("bytes") is not None:
+                header, image = parse_frame(message["bytes"])
+                if header.kind != KIND_JPEG:
+                    raise ProtocolError("/ws takes images; send landmark frames to /ws/landmarks")
             else:
-                await ws.send_json({"label": "collecting", "confidence": 0.0})
+                try:
+                    image = json.loads(message["text"]).get("image")
+                except (ValueError, TypeError, AttributeError):
+                    raise ProtocolError('Expected JSON {"image": "<base64 JPEG>"}') from None
+                if not image:
+                    return True
+        except ProtocolError as exc:
+            await ws.close(code=1003, reason=str(exc))
+            return False
+        try:
+            vectors = await frame_to_vectors(extractor, image)
+        except WorkerError as exc:
+            # Worker exited, hung (and was killed) or failed the frame; the session can't go on
+            await ws.close(code=1011, reason=str(exc)[:120])
+            return False
+        await advance(window, stream, vectors)
+        await send_result(ws, window, header)
+        return True
+
+    try:
+        await serve_latest(ws, handle, "/ws")
+    except WebSocketDisconnect:
+        return
+    finally:
+        await session_pool.release(extractor, profile)
+
+
+@app.websocket("/ws/landmarks")
+async def websocket_landmarks(ws: WebSocket):
+    """
+    Same replies as /ws for clients that run MediaPipe themselves: each
+    message is one feature vector in the model's schema (GET /schema), binary
+    float32 / int16 (see ws_protocol) or JSON {"landmarks": [...]}. No decode,
+    no extraction and no pooled extractor; the server only runs the model.
+    """
+    await ws.accept()
+    if not readiness["model"]:
+        await ws.close(code=1013, reason="Server is starting, try again later")
+        return
+    window, stream = SequenceWindow(totals=frame_totals), new_stream()
+
+    async def handle(message: dict) -> bool:
+        header: Optional[FrameHeader] = None
+        try:
+            if message.get("bytes") is not None:
+                header, payload = parse_frame(message["bytes"])
+                vector = unpack_landmarks(header, payload, schema.num_features)
+            else:
+                try:
+                    payload = json.loads(message["text"])
+                    vector = np.asarray(payload.get("landmarks") or [], dtype=np.float32)
+                except (ValueError, TypeError, AttributeError):
+                    raise ProtocolError('Expected JSON {"landmarks": [numbers]}') from None
+                if vector.shape != (schema.num_features,):
+                    raise ProtocolError(f"Expected {schema.num_features} values ({schema.name})")
+        except ProtocolError as exc:
+            await ws.close(code=1003, reason=str(exc))
+            return False
+        # All zeros = no person in the frame, like a None from an extractor
+        await advance(window, stream, [vector] if vector.any() else [])
+        await send_result(ws, window, header)
+        return True
+
+    try:
+        await serve_latest(ws, handle, "/ws/landmarks")
     except WebSocketDisconnect:
         return
 
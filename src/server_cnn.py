@@ -7,7 +7,9 @@ Run:
 from __future__ import annotations
 
 import base64
+import collections
 import json
+import threading
 from typing import List
 
 import cv2
@@ -15,10 +17,13 @@ import numpy as np
 import tensorflow as tf
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 from src import config
 from src.utils.data_utils import load_label_map
+from src.utils.metrics import CONTENT_TYPE, MetricsText
+from src.utils.profiling import PROFILER
 
 
 app = FastAPI(title="ISL CNN Recognition API", version="1.0")
@@ -30,8 +35,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GET /metrics reports the stage timings, so record them unless metrics are off
+if config.METRICS_ENABLED:
+    PROFILER.enabled = True
+
 model = tf.keras.models.load_model(config.MODEL_DIR / "isl_cnn.h5")
 label_map = load_label_map()
+# Websocket frames received / undecodable, predictions made; open sessions
+frame_totals: collections.Counter = collections.Counter()
+# predict_frame also runs in Starlette's threadpool (sync /predict_image)
+predicted_lock = threading.Lock()
+active_sessions = 0
 
 
 def preprocess_frame(frame: np.ndarray) -> np.ndarray:
@@ -54,44 +68,70 @@ def get_labels():
     return {"labels": label_map}
 
 
+@app.get("/metrics")
+def get_metrics():
+    """Prometheus scrape endpoint"""
+    text = MetricsText()
+    text.stage_histograms(PROFILER)
+    text.add("isl_sessions_active", "gauge", "Open websocket sessions", [({"endpoint": "/ws"}, active_sessions)])
+    text.add("isl_frames_received_total", "counter", "Websocket frames received", frame_totals["received"])
+    text.add("isl_frames_invalid_total", "counter", "Websocket frames that could not be decoded", frame_totals["invalid"])
+    text.add("isl_predictions_total", "counter", "Model predictions (websocket and REST)", frame_totals["predicted"])
+    return PlainTextResponse(text.render(), media_type=CONTENT_TYPE)
+
+
+def decode_frame(image_b64: str):
+    with PROFILER.stage("decode"):
+        img_bytes = base64.b64decode(image_b64.split(",")[-1])
+        return cv2.imdecode(np.frombuffer(img_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+
+def predict_frame(frame: np.ndarray) -> np.ndarray:
+    with PROFILER.stage("predict"):
+        probs = model.predict(preprocess_frame(frame), verbose=0)[0]
+    with predicted_lock:
+        frame_totals["predicted"] += 1
+    return probs
+
+
 @app.post("/predict_image")
 def predict_image(req: PredictImageRequest):
-    img_b64 = req.image_base64
-    img_bytes = base64.b64decode(img_b64.split(",")[-1])
-    img_arr = np.frombuffer(img_bytes, dtype=np.uint8)
-    frame = cv2.imdecode(img_arr, cv2.IMREAD_COLOR)
+    frame = decode_frame(req.image_base64)
     if frame is None:
         return {"error": "Could not decode image"}
 
-    inp = preprocess_frame(frame)
-    probs = model.predict(inp, verbose=0)[0]
+    probs = predict_frame(frame)
     idx = int(np.argmax(probs))
     return {"label": label_map.get(idx, "unknown"), "confidence": float(np.max(probs))}
 
 
 @app.websocket("/ws")
 async def websocket_predict(ws: WebSocket):
+    global active_sessions
     await ws.accept()
+    active_sessions += 1
     try:
         while True:
             data = await ws.receive_text()
+            frame_totals["received"] += 1
             payload = json.loads(data)
             image_b64 = payload.get("image")
             if not image_b64:
                 continue
-            img_bytes = base64.b64decode(image_b64.split(",")[-1])
-            image_array = np.frombuffer(img_bytes, dtype=np.uint8)
-            frame = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
+            frame = decode_frame(image_b64)
             if frame is None:
+                frame_totals["invalid"] += 1
                 await ws.send_json({"label": "error", "confidence": 0.0})
                 continue
 
-            inp = preprocess_frame(frame)
-            probs = model.predict(inp, verbose=0)[0]
+            probs = predict_frame(frame)
             idx = int(np.argmax(probs))
             conf = float(np.max(probs))
-            await ws.send_json({"label": label_map.get(idx, "unknown"), "confidence": conf})
+            with PROFILER.stage("send"):
+                await ws.send_json({"label": label_map.get(idx, "unknown"), "confidence": conf})
     except WebSocketDisconnect:
         return
+    finally:
+        active_sessions -= 1
 
 
@@ -16,6 +16,7 @@ from sklearn.metrics import classification_report
 from src import config
 from src.models.lstm_classifier import build_model
 from src.utils import data_utils
+from src.utils.feature_schema import load_dataset_schema, model_schema_path, save_schema
 
 
 def train(model_path: Path):
@@ -43,7 +44,9 @@ def train(model_path: Path):
     class_weight_dict = {int(cls): weight for cls, weight in zip(classes, class_weights)}
     print(f"Class weights: {class_weight_dict}\n")
 
-    model = build_model(num_classes=len(idx_to_label))
+    schema = load_dataset_schema()
+    print(f"Feature schema: {schema.name} (v{schema.version}, {schema.num_features} features)\n")
+    model = build_model(num_classes=len(idx_to_label), num_features=schema.num_features)
     callbacks = [
         tf.keras.callbacks.ModelCheckpoint(
             filepath=model_path,
@@ -74,6 +77,8 @@ def train(model_path: Path):
     # Save label map for inference
     data_utils.save_label_map(idx_to_label)
     print(f"Saved label map to {config.MODEL_DIR / 'label_map.json'}")
+    # Record the vector layout so inference and serving extract the same features
+    print(f"Saved feature schema to {save_schema(schema, model_schema_path(model_path))}")
     return history
 
 
@@ -0,0 +1,110 @@
+"""
+Cross-session micro-batching for sequence model inference.
+
+Every websocket session produces one (SEQUENCE_LENGTH, features) window per
+frame. Predicting them one at a time is dominated by per-call overhead, so
+sessions hand their windows to a shared BatchScheduler instead:
+
+    probs = await scheduler.predict(window)
+
+A single worker task takes the first waiting window, keeps collecting until
+`max_batch_size` windows are queued or `max_wait_ms` has passed, runs one
+batched call on the executor and fans the rows back out to the waiting
+sessions. While a batch runs, new windows queue up for the next one, so
+under load batches fill without waiting and at low load a window waits at
+most max_wait_ms.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from src import config
+from src.utils.profiling import PROFILER
+
+# Batch size buckets for the servers' model-call metrics
+BATCH_SIZE_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class BatchScheduler:
+    def __init__(
+        self,
+        predict_batch: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = config.BATCH_MAX_SIZE,
+        max_wait_ms: float = config.BATCH_MAX_WAIT_MS,
+        executor: Optional[Executor] = None,
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self.executor = executor
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.windows = 0
+        self.largest_batch = 0
+
+    async def predict(self, window: np.ndarray) -> np.ndarray:
+        """Class probabilities for one window, computed as part of a batch."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((window, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        # Sessions that went away while waiting don't need a result
+        return [(window, future) for window, future in batch if not future.done()]
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+            try:
+                # Inside the try: one mismatched window must fail its batch, not the worker
+                windows = np.stack([window for window, _ in batch])
+                with PROFILER.stage("predict_batch"):
+                    probs = await loop.run_in_executor(self.executor, self.predict_batch, windows)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            self.batches += 1
+            self.windows += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            for (_, future), row in zip(batch, probs):
+                if not future.done():
+                    future.set_result(row)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "windows": self.windows,
+            "mean_batch_size": self.windows / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "queued": self._queue.qsize(),
+        }
+
+    def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
@@ -8,6 +8,7 @@ import numpy as np
 from sklearn.model_selection import train_test_split
 
 from src import config
+from src.utils.feature_schema import load_dataset_schema
 
 
 def save_sequence(sequence: List[np.ndarray], label: str, sample_id: int):
@@ -21,6 +22,7 @@ def save_sequence(sequence: List[np.ndarray], label: str, sample_id: int):
 def load_dataset() -> Tuple[np.ndarray, np.ndarray, Dict[int, str]]:
     X, y = [], []
     label_to_idx: Dict[str, int] = {}
+    num_features = load_dataset_schema().num_features
 
     for label_dir in sorted(config.DATA_DIR.glob("*")):
         if not label_dir.is_dir():
@@ -33,15 +35,15 @@ def load_dataset() -> Tuple[np.ndarray, np.ndarray, Dict[int, str]]:
             if seq.shape[0] != config.SEQUENCE_LENGTH:
                 continue  # skip incomplete clips
             
-            # Normalize feature dimension to exactly NUM_LANDMARKS
-            if seq.shape[1] != config.NUM_LANDMARKS:
+            # Normalize feature dimension to exactly the dataset schema's width
+            if seq.shape[1] != num_features:
                 # Pad or truncate each frame
                 normalized_frames = []
                 for frame in seq:
-                    if frame.shape[0] < config.NUM_LANDMARKS:
-                        frame = np.concatenate([frame, np.zeros(config.NUM_LANDMARKS - frame.shape[0], dtype=np.float32)])
+                    if frame.shape[0] < num_features:
+                        frame = np.concatenate([frame, np.zeros(num_features - frame.shape[0], dtype=np.float32)])
                     else:
-                        frame = frame[:config.NUM_LANDMARKS]
+                        frame = frame[:num_features]
                     normalized_frames.append(frame)
                 seq = np.stack(normalized_frames)
             
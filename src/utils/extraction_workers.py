@@ -0,0 +1,332 @@
+"""
+Landmark extraction in worker processes, behind the same checkout/release
+interface as ExtractorPool.
+
+In one server process all sessions' MediaPipe and OpenCV work shares one GIL
+and one set of native thread pools, which leaves most cores of a large node
+idle. ExtractionWorkers starts N spawned processes instead; each owns the
+extractors (tracker triples) of the sessions routed to it:
+
+- routing is sticky: a session is assigned to the least-loaded worker at
+  checkout and all its frames go there, so tracker state never moves;
+- each session gets a SharedMemory block that the event loop copies the
+  encoded frame into; the worker decodes straight from it, so only a few
+  bytes of control message (and the small landmark vectors back) cross the
+  pipe;
+- a reader thread per worker resolves the asyncio futures of its replies;
+- a worker that dies, or hangs past `timeout` on a request (and is killed),
+  fails its sessions with WorkerError and is respawned at the next checkout.
+
+    workers = ExtractionWorkers(8, functools.partial(create_extractor, schema=schema))
+    await workers.wait_ready()  # optional; workers warm up in the background
+    session = await workers.checkout(profile, timeout)
+    vectors = await session.extract(jpeg_bytes)
+    await workers.release(session, profile)
+
+A session has at most one frame in flight (its websocket handler awaits each
+frame), which is what makes a single shared-memory block per session enough.
+Frames larger than the block are treated like undecodable ones.
+"""
+from __future__ import annotations
+
+import asyncio
+import collections
+import itertools
+import math
+import multiprocessing
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from src import config
+from src.utils.extractor_pool import PoolExhausted
+from src.utils.extractors import Extractor
+from src.utils.image_utils import decode_image, encoded_bytes
+from src.utils.profiling import PROFILER
+
+
+class WorkerError(RuntimeError):
+    """An extraction worker failed a request, exited or hung."""
+
+
+def _worker_main(conn, factory: Callable[..., Extractor], default_profile: str, warm: int):
+    """Worker process loop: (op, request id, session id, args) in, (request id, error, result) out."""
+    import cv2
+
+    # N workers already use N cores; don't let each one's OpenCV spin up its own pool
+    cv2.setNumThreads(1)
+
+    def build(profile: str) -> Extractor:
+        extractor = factory(profile=profile or None)
+        extractor.extract(np.zeros((480, 640, 3), dtype=np.uint8))
+        extractor.reset()
+        return extractor
+
+    idle: Dict[str, List[Extractor]] = collections.defaultdict(list)
+    for _ in range(warm):
+        idle[default_profile].append(build(default_profile))
+    sessions = {}
+    while True:
+        try:
+            op, rid, sid, args = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if op == "stop":
+            break
+        try:
+            result = None
+            if op == "frame":
+                extractor, _, shm = sessions[sid]
+                view = shm.buf[: args[0]]
+                try:
+                    frame = decode_image(view, config.WORKING_RESOLUTION)
+                finally:
+                    view.release()
+                if frame is not None:
+                    extractor.submit(frame)
+                    result = [landmarks for landmarks in extractor.poll() if landmarks is not None]
+                else:
+                    result = []
+            elif op == "open":
+                profile, shm_name = args
+                extractor = idle[profile].pop() if idle[profile] else build(profile)
+                sessions[sid] = (extractor, profile, SharedMemory(name=shm_name))
+            elif op == "ping":
+                pass  # answered once the warm-up above is done
+            elif op == "close":
+                extractor, profile, shm = sessions.pop(sid)
+                shm.close()
+                extractor.reset()
+                if len(idle[profile]) < warm:
+                    idle[profile].append(extractor)
+                else:
+                    extractor.close()
+            else:
+                raise ValueError(f"Unknown extraction worker op: {op!r}")
+        except Exception as exc:
+            # Native exceptions don't always pickle; the message is enough for the caller
+            conn.send((rid, f"{type(exc).__name__}: {exc}", None))
+        else:
+            conn.send((rid, None, result))
+
+    for extractor, _, shm in sessions.values():
+        shm.close()
+        extractor.close()
+    for extractors in idle.values():
+        for extractor in extractors:
+            extractor.close()
+
+
+class _Worker:
+    def __init__(self, ctx, index: int, factory: Callable[..., Extractor], default_profile: str, warm: int):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child, factory, default_profile, warm),
+            name=f"isl-extract-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        self.sessions = 0
+        self._ids = itertools.count()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _read(self):
+        while True:
+            try:
+                rid, error, result = self.conn.recv()
+            except (EOFError, OSError):
+                self._loop.call_soon_threadsafe(self._fail_pending)
+                return
+            self._loop.call_soon_threadsafe(self._resolve, rid, error, result)
+
+    def _resolve(self, rid: int, error: Optional[str], result):
+        future = self._pending.pop(rid, None)
+        if future is None or future.done():
+            return  # caller went away
+        if error is not None:
+            future.set_exception(WorkerError(f"Extraction worker {self.process.name}: {error}"))
+        else:
+            future.set_result(result)
+
+    def _fail_pending(self):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(WorkerError(f"Extraction worker {self.process.name} exited"))
+        self._pending.clear()
+
+    async def call(self, op: str, sid: int, *args, timeout: Optional[float] = None):
+        if self._reader is None:
+            self._loop = asyncio.get_running_loop()
+            self._reader = threading.Thread(target=self._read, name=f"{self.process.name}-reader", daemon=True)
+            self._reader.start()
+        if not self.process.is_alive():
+            raise WorkerError(f"Extraction worker {self.process.name} exited")
+        rid = next(self._ids)
+        future = self._loop.create_future()
+        self._pending[rid] = future
+        try:
+            try:
+                self.conn.send((op, rid, sid, args))
+            except OSError:
+                raise WorkerError(f"Extraction worker {self.process.name} exited") from None
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # Alive but stuck (native deadlock): kill it so checkout respawns it,
+            # and its other sessions fail instead of waiting on it too
+            self.process.kill()
+            self.process.join(timeout=1)
+            raise WorkerError(f"Extraction worker {self.process.name} hung on {op!r} for {timeout:g}s") from None
+        finally:
+            self._pending.pop(rid, None)
+
+    def notify(self, op: str, sid: int, *args):
+        """Send an op without waiting for (or wanting) its reply."""
+        try:
+            self.conn.send((op, next(self._ids), sid, args))
+        except (BrokenPipeError, OSError):
+            pass  # worker gone; nothing left to tell it
+
+    def stats(self) -> dict:
+        return {
+            "pid": self.process.pid,
+            "alive": self.process.is_alive(),
+            "sessions": self.sessions,
+            "pending": len(self._pending),
+        }
+
+
+class WorkerSession:
+    """A session's handle on its worker; `extract` replaces decode + extractor.submit/poll."""
+
+    def __init__(self, worker: _Worker, sid: int, shm: SharedMemory, capacity: int, timeout: Optional[float] = None):
+        self.worker = worker
+        self.sid = sid
+        self.shm = shm
+        self.capacity = capacity
+        self.timeout = timeout
+
+    async def extract(self, data: Union[bytes, memoryview, str]) -> List[np.ndarray]:
+        """Landmark vectors (person found) finished by the worker for this encoded frame."""
+        data = encoded_bytes(data)
+        size = len(data)
+        if size > self.capacity:
+            return []
+        self.shm.buf[:size] = data
+        with PROFILER.stage("extract_remote"):
+            return await self.worker.call("frame", self.sid, size, timeout=self.timeout)
+
+
+class ExtractionWorkers:
+    def __init__(
+        self,
+        processes: int,
+        factory: Callable[..., Extractor],
+        size: int = config.SESSION_POOL_SIZE,
+        default_profile: str = config.TRACKER_PROFILE,
+        shm_bytes: int = config.EXTRACTION_SHM_BYTES,
+        timeout: Optional[float] = config.EXTRACTION_WORKER_TIMEOUT,
+    ):
+        """`factory(profile=...)` builds an extractor inside a worker, so it must pickle (e.g. a functools.partial)."""
+        self.size = max(1, size)
+        self.default_profile = default_profile or ""
+        self.shm_bytes = shm_bytes
+        self.timeout = timeout or None
+        # spawn: workers import MediaPipe and OpenCV but not the server (or TensorFlow)
+        self._ctx = multiprocessing.get_context("spawn")
+        self._factory = factory
+        processes = max(1, processes)
+        self._warm = math.ceil(self.size / processes)
+        self._workers = [self._start_worker(i) for i in range(processes)]
+        self._slots = asyncio.Semaphore(self.size)
+        self._ids = itertools.count()
+        self.in_use = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def _start_worker(self, index: int) -> _Worker:
+        return _Worker(self._ctx, index, self._factory, self.default_profile, self._warm)
+
+    def _restart_dead(self):
+        """Replace workers that died (native abort, OOM kill) so capacity doesn't shrink for good."""
+        for i, worker in enumerate(self._workers):
+            if worker.process.is_alive():
+                continue
+            # Its sessions fail on their next frame and are released against the old worker
+            worker.process.join(timeout=0)
+            worker.conn.close()
+            self._workers[i] = self._start_worker(i)
+            self.restarts += 1
+
+    async def wait_ready(self):
+        """Return once every worker has built and warmed up its extractors."""
+        await asyncio.gather(*(worker.call("ping", -1) for worker in self._workers))
+
+    async def checkout(self, profile: Optional[str] = None, timeout: Optional[float] = None) -> WorkerSession:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise PoolExhausted(f"All {self.size} extraction sessions are in use") from None
+        self._restart_dead()
+        worker = min((w for w in self._workers if w.process.is_alive()), key=lambda w: w.sessions, default=None)
+        shm = None
+        try:
+            if worker is None:
+                raise WorkerError("No extraction worker is alive")
+            sid = next(self._ids)
+            shm = SharedMemory(create=True, size=self.shm_bytes)
+            await worker.call("open", sid, profile or self.default_profile, shm.name, timeout=self.timeout)
+        except BaseException:
+            if shm is not None:
+                # Cancelled (client gone, handshake timeout) after the open was
+                # sent: the worker still opens the session, so close it there too
+                worker.notify("close", sid)
+                shm.close()
+                shm.unlink()
+            self._slots.release()
+            raise
+        worker.sessions += 1
+        self.in_use += 1
+        self.checkouts += 1
+        return WorkerSession(worker, sid, shm, self.shm_bytes, self.timeout)
+
+    async def release(self, session: WorkerSession, profile: Optional[str] = None):
+        """Reset the session's extractor in its worker and free its slot and shared memory."""
+        try:
+            await session.worker.call("close", session.sid, timeout=self.timeout)
+        except WorkerError:
+            pass  # worker gone; nothing left to reset
+        finally:
+            session.shm.close()
+            session.shm.unlink()
+            session.worker.sessions -= 1
+            self.in_use -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "in_use": self.in_use,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "restarts": self.restarts,
+            "workers": [worker.stats() for worker in self._workers],
+        }
+
+    def close(self):
+        for worker in self._workers:
+            try:
+                worker.conn.send(("stop", None, None, ()))
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
@@ -0,0 +1,143 @@
+"""
+Bounded pool of pre-warmed landmark extractors for concurrent streams.
+
+Extractors run their trackers in tracking mode and carry temporal state from
+frame to frame, so two streams must never share one. The server checks an
+extractor out per websocket session and returns it, reset, on disconnect:
+
+    async with pool.session(profile) as extractor:
+        ...
+
+The pool holds at most `size` extractors. The default tracker profile's are
+built and warmed up front, so connecting never pays tracker construction;
+a session asking for another profile gets one built on demand (replacing an
+idle extractor if the pool is full). When all `size` are checked out, new
+sessions wait up to `timeout` seconds and then get PoolExhausted.
+
+With prebuild=False the up-front extractors are built later by `await
+pool.fill()` (in a thread), e.g. in the background while the server starts.
+"""
+from __future__ import annotations
+
+import asyncio
+import collections
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from src import config
+from src.utils.extractors import Extractor
+
+
+class PoolExhausted(Exception):
+    """No extractor became free within the checkout timeout."""
+
+
+class ExtractorPool:
+    def __init__(
+        self,
+        size: int,
+        factory: Callable[[Optional[str]], Extractor],
+        default_profile: str = config.TRACKER_PROFILE,
+        warm_up: bool = True,
+        prebuild: bool = True,
+    ):
+        self.size = max(1, size)
+        self.default_profile = default_profile or ""
+        self._factory = factory
+        self._warm_up = warm_up
+        self._idle: Dict[str, List[Extractor]] = collections.defaultdict(list)
+        self._slots = asyncio.Semaphore(self.size)
+        self._alive = 0
+        self.in_use = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        if prebuild:
+            self._prebuild()
+
+    def _prebuild(self):
+        while self._alive < self.size:
+            self._idle[self.default_profile].append(self._build(self.default_profile))
+            self._alive += 1
+
+    async def fill(self):
+        """Build and warm up the default profile's extractors off the event loop."""
+        await asyncio.to_thread(self._prebuild)
+
+    def _key(self, profile: Optional[str]) -> str:
+        return profile or self.default_profile
+
+    def _build(self, key: str) -> Extractor:
+        extractor = self._factory(key or None)
+        if self._warm_up:
+            # First process() call initializes the inference backends; keep that off the connect path
+            extractor.extract(np.zeros((480, 640, 3), dtype=np.uint8))
+            extractor.reset()
+        return extractor
+
+    async def checkout(self, profile: Optional[str] = None, timeout: Optional[float] = None) -> Extractor:
+        key = self._key(profile)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise PoolExhausted(f"All {self.size} extractors are in use") from None
+        self.in_use += 1
+        self.checkouts += 1
+        idle = self._idle[key]
+        if idle:
+            return idle.pop()
+
+        victim = None
+        if self._alive >= self.size:
+            # Pool is full of idle extractors for other profiles: replace one
+            victim = next(extractors for extractors in self._idle.values() if extractors).pop()
+        else:
+            self._alive += 1
+        try:
+            if victim is not None:
+                await asyncio.to_thread(victim.close)
+            return await asyncio.to_thread(self._build, key)
+        except BaseException:
+            self._alive -= 1
+            self.in_use -= 1
+            self._slots.release()
+            raise
+
+    async def release(self, extractor: Extractor, profile: Optional[str] = None):
+        """Reset `extractor` (off the event loop) and make it available again."""
+        try:
+            await asyncio.to_thread(extractor.reset)
+        except Exception:
+            # Not reusable; drop it and let the slot be rebuilt on demand
+            self._alive -= 1
+            await asyncio.to_thread(extractor.close)
+        else:
+            self._idle[self._key(profile)].append(extractor)
+        finally:
+            self.in_use -= 1
+            self._slots.release()
+
+    @asynccontextmanager
+    async def session(self, profile: Optional[str] = None, timeout: Optional[float] = None):
+        extractor = await self.checkout(profile, timeout)
+        try:
+            yield extractor
+        finally:
+            await self.release(extractor, profile)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "in_use": self.in_use,
+            "idle": {key or "default": len(extractors) for key, extractors in self._idle.items()},
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+        }
+
+    def close(self):
+        for extractors in self._idle.values():
+            for extractor in extractors:
+                extractor.close()
+            extractors.clear()
@@ -0,0 +1,127 @@
+"""
+Landmark extractor interface and backend factory.
+
+Consumers (server, inference, data collection, video conversion) depend only
+on the Extractor protocol and get an implementation from create_extractor():
+
+- "solutions": HolisticExtractor on mp.solutions (synchronous)
+- "tasks":     TasksExtractor on the MediaPipe Tasks API (LIVE_STREAM)
+- "synthetic": SyntheticExtractor, generated landmarks at a configurable
+               cost, so the rest of the pipeline can be load-tested and
+               profiled on machines without a camera or MediaPipe
+
+Backends are imported lazily, so selecting "synthetic" never imports MediaPipe.
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Protocol
+
+import numpy as np
+
+from src import config
+from src.utils.feature_schema import FeatureSchema
+from src.utils.tracker_profiles import TrackerProfile, get_profile
+
+
+EXTRACTOR_BACKENDS = ("solutions", "tasks", "synthetic")
+
+# Options understood by each backend; anything else passed to create_extractor
+# is dropped for backends that do not support it
+SOLUTIONS_OPTIONS = (
+    "gate_on_pose",
+    "hand_roi",
+    "pose_every",
+    "face_every",
+    "motion_threshold",
+    "downscale",
+    "working_resolution",
+)
+SYNTHETIC_OPTIONS = ("cost_ms", "presence", "seed", "spin")
+
+
+class Extractor(Protocol):
+    """Turns BGR frames into float32 feature-schema vectors (None = no person)."""
+
+    def extract(self, image: np.ndarray, draw: bool = False) -> Optional[np.ndarray]:
+        """Blocking: the vector for this frame."""
+        ...
+
+    def submit(self, image: np.ndarray, timestamp_ms: Optional[int] = None, draw: bool = False):
+        """Hand over a frame; its vector shows up in a later poll()."""
+        ...
+
+    def poll(self) -> List[Optional[np.ndarray]]:
+        """Vectors finished since the last poll, oldest first."""
+        ...
+
+    def reset(self):
+        """Drop temporal tracking state so the extractor can serve a new stream."""
+        ...
+
+    def stats(self) -> dict:
+        ...
+
+    def close(self):
+        ...
+
+
+def create_extractor(
+    backend: Optional[str] = None,
+    static_image_mode: bool = False,
+    max_num_hands: int = 2,
+    schema: Optional[FeatureSchema] = None,
+    profile: Optional[str] = None,
+    **options,
+) -> Extractor:
+    """
+    Build the landmark extractor selected by `backend` (default: config.EXTRACTOR_BACKEND).
+
+    Solutions options (gate_on_pose, hand_roi, pose_every, face_every,
+    motion_threshold, downscale) default to the values in config, or to the
+    tracker `profile` (default: config.TRACKER_PROFILE) when one is selected;
+    explicit options win over both. working_resolution (solutions and tasks)
+    defaults to 0, native size; the server passes config.WORKING_RESOLUTION.
+    The tasks backend schedules its graphs itself. Synthetic options: cost_ms, presence, seed, spin.
+    `schema` sets the output layout (default: config.FEATURE_SCHEMA).
+    """
+    backend = backend or config.EXTRACTOR_BACKEND
+    tracker_profile: Optional[TrackerProfile] = get_profile(profile)
+    if backend == "solutions":
+        from src.utils.mediapipe_utils import HolisticExtractor
+
+        pipeline = dict(
+            gate_on_pose=config.GATE_ON_POSE,
+            hand_roi=config.HAND_ROI,
+            pose_every=config.POSE_EVERY_N_FRAMES,
+            face_every=config.FACE_EVERY_N_FRAMES,
+            motion_threshold=config.MOTION_THRESHOLD,
+        )
+        if tracker_profile is not None:
+            pipeline.update(
+                pose_every=tracker_profile.pose_every,
+                face_every=tracker_profile.face_every,
+                downscale=tracker_profile.downscale,
+            )
+        pipeline.update({k: v for k, v in options.items() if k in SOLUTIONS_OPTIONS})
+        return HolisticExtractor(
+            static_image_mode=static_image_mode,
+            max_num_hands=max_num_hands,
+            schema=schema,
+            profile=tracker_profile,
+            **pipeline,
+        )
+    if backend == "tasks":
+        from src.utils.mediapipe_tasks import TasksExtractor
+
+        return TasksExtractor(
+            static_image_mode=static_image_mode,
+            max_num_hands=max_num_hands,
+            schema=schema,
+            profile=tracker_profile,
+            working_resolution=options.get("working_resolution", 0),
+        )
+    if backend == "synthetic":
+        from src.utils.synthetic_extractor import SyntheticExtractor
+
+        return SyntheticExtractor(schema=schema, **{k: v for k, v in options.items() if k in SYNTHETIC_OPTIONS})
+    raise ValueError(f"Unknown extractor backend: {backend!r} (expected one of {EXTRACTOR_BACKENDS})")
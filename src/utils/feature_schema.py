@@ -0,0 +1,239 @@
+"""
+Named, versioned layouts of the per-frame landmark vector.
+
+A schema fixes which landmarks go into the vector and at which offsets:
+
+    [hands (2 * 21 points)] [face subset] [pose subset]     each point = (x, y, z)
+
+Schemas are written next to every trained model (<model>.schema.json) and
+into the dataset folder, so extraction, training and serving agree on the
+layout instead of padding or truncating to a hard-coded width.
+
+Built-in schemas:
+- legacy_v1:  the original 1563-wide vector. Face mesh runs with
+              refine_landmarks=True (478 points) and the old code truncated
+              hands + face + pose to 1563 values, so the pose block is shifted
+              by the 10 iris points and mostly cut off (only the nose
+              survives) whenever a face is found. Kept bit-for-bit so existing
+              datasets and models keep working.
+- full_v2:    hands, the 468 base face mesh points and the 11 upper body pose
+              points at fixed offsets (1563 values, no iris refinement).
+- compact_v2: hands, ~100 expressive face points (lips, eyes, eyebrows, nose
+              ridge) and the pose points: 459 values, ~30% of the full width.
+"""
+from __future__ import annotations
+
+import json
+import operator
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src import config
+
+
+HANDS = 2
+HAND_POINTS = 21
+FACE_MESH_POINTS = 468
+FACE_MESH_REFINED_POINTS = 478
+
+# Upper body key point indices into MediaPipe Pose's 33 landmarks
+# 0=nose, 2=left_eye, 5=right_eye, 7=left_ear, 8=right_ear
+# 11=left_shoulder, 12=right_shoulder, 13=left_elbow, 14=right_elbow
+# 15=left_wrist, 16=right_wrist
+UPPER_BODY_INDICES = (0, 2, 5, 7, 8, 11, 12, 13, 14, 15, 16)
+
+# Face mesh subsets (same points as mp.solutions.face_mesh_connections)
+FACE_LIPS = (
+    0, 13, 14, 17, 37, 39, 40, 61, 78, 80, 81, 82, 84, 87, 88, 91, 95, 146, 178, 181,
+    185, 191, 267, 269, 270, 291, 308, 310, 311, 312, 314, 317, 318, 321, 324, 375, 402, 405, 409, 415,
+)
+FACE_LEFT_EYE = (249, 263, 362, 373, 374, 380, 381, 382, 384, 385, 386, 387, 388, 390, 398, 466)
+FACE_RIGHT_EYE = (7, 33, 133, 144, 145, 153, 154, 155, 157, 158, 159, 160, 161, 163, 173, 246)
+FACE_LEFT_EYEBROW = (276, 282, 283, 285, 293, 295, 296, 300, 334, 336)
+FACE_RIGHT_EYEBROW = (46, 52, 53, 55, 63, 65, 66, 70, 105, 107)
+FACE_NOSE_RIDGE = (1, 2, 4, 5, 6, 168, 195, 197)
+FACE_COMPACT = (
+    FACE_LIPS + FACE_LEFT_EYE + FACE_RIGHT_EYE + FACE_LEFT_EYEBROW + FACE_RIGHT_EYEBROW + FACE_NOSE_RIDGE
+)
+
+
+@dataclass(frozen=True)
+class FeatureSchema:
+    name: str
+    version: int
+    face_indices: Tuple[int, ...]
+    pose_indices: Tuple[int, ...] = UPPER_BODY_INDICES
+    # legacy_v1 only: concat-then-truncate packing of a 478-point face mesh
+    legacy_packing: bool = False
+
+    @property
+    def hand_offset(self) -> int:
+        return 0
+
+    @property
+    def hand_size(self) -> int:
+        return HANDS * HAND_POINTS * 3
+
+    @property
+    def face_offset(self) -> int:
+        return self.hand_offset + self.hand_size
+
+    @property
+    def face_size(self) -> int:
+        return len(self.face_indices) * 3
+
+    @property
+    def pose_offset(self) -> int:
+        return self.face_offset + self.face_size
+
+    @property
+    def pose_size(self) -> int:
+        return len(self.pose_indices) * 3
+
+    @property
+    def num_features(self) -> int:
+        return self.pose_offset + self.pose_size
+
+    @property
+    def blocks(self) -> Dict[str, Tuple[int, int]]:
+        """Block name -> (offset, size) in the nominal layout."""
+        return {
+            "hands": (self.hand_offset, self.hand_size),
+            "face": (self.face_offset, self.face_size),
+            "pose": (self.pose_offset, self.pose_size),
+        }
+
+    @property
+    def refine_face(self) -> bool:
+        """Whether the face tracker must produce the 10 iris points."""
+        return self.legacy_packing or max(self.face_indices) >= FACE_MESH_POINTS
+
+    @cached_property
+    def _pick_face(self):
+        return operator.itemgetter(*self.face_indices)
+
+    @cached_property
+    def _pick_pose(self):
+        return operator.itemgetter(*self.pose_indices)
+
+    def pack(self, hands: List, face, pose, out: np.ndarray) -> bool:
+        """
+        Write landmark sequences (anything with .x/.y/.z) into `out`
+        (float32, num_features): hands in Left/Right slot order, the full face
+        mesh and all 33 pose points, None when not detected. Missing blocks are
+        zero. Returns False (buffer zeroed) when there is no pose, i.e. no person.
+        """
+        out.fill(0.0)
+        if pose is None:
+            return False
+
+        for slot, h_landmarks in enumerate(hands[:HANDS]):
+            write_xyz(out, self.hand_offset + slot * HAND_POINTS * 3, h_landmarks, HAND_POINTS)
+
+        if self.legacy_packing:
+            # Original behaviour: face points as returned, pose right after them, clipped
+            pose_offset = self.pose_offset
+            if face is not None:
+                count = min(len(face), (out.shape[0] - self.face_offset) // 3)
+                write_xyz(out, self.face_offset, face, count)
+                pose_offset = self.face_offset + 3 * count
+            room = (out.shape[0] - pose_offset) // 3
+            if room > 0:
+                upper_body = self._pick_pose(pose)
+                write_xyz(out, pose_offset, upper_body, min(room, len(upper_body)))
+            return True
+
+        if face is not None and len(face) > max(self.face_indices):
+            write_xyz(out, self.face_offset, self._pick_face(face), len(self.face_indices))
+        write_xyz(out, self.pose_offset, self._pick_pose(pose), len(self.pose_indices))
+        return True
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FeatureSchema":
+        return cls(
+            name=data["name"],
+            version=int(data["version"]),
+            face_indices=tuple(data["face_indices"]),
+            pose_indices=tuple(data["pose_indices"]),
+            legacy_packing=bool(data.get("legacy_packing", False)),
+        )
+
+
+def write_xyz(out: np.ndarray, offset: int, landmarks, count: int):
+    """Write (x, y, z) of the first `count` landmarks into out[offset:] as strided columns."""
+    block = out[offset : offset + 3 * count]
+    block[0::3] = np.fromiter((lm.x for lm in landmarks), dtype=np.float32, count=count)
+    block[1::3] = np.fromiter((lm.y for lm in landmarks), dtype=np.float32, count=count)
+    block[2::3] = np.fromiter((lm.z for lm in landmarks), dtype=np.float32, count=count)
+
+
+SCHEMAS: Dict[str, FeatureSchema] = {
+    schema.name: schema
+    for schema in (
+        FeatureSchema("legacy_v1", 1, tuple(range(FACE_MESH_POINTS)), legacy_packing=True),
+        FeatureSchema("full_v2", 2, tuple(range(FACE_MESH_POINTS))),
+        FeatureSchema("compact_v2", 2, FACE_COMPACT),
+    )
+}
+LEGACY_SCHEMA = SCHEMAS["legacy_v1"]
+SCHEMA_FILENAME = "feature_schema.json"
+
+
+def get_schema(name: Optional[str] = None) -> FeatureSchema:
+    """Built-in schema by name (default: config.FEATURE_SCHEMA)."""
+    name = name or config.FEATURE_SCHEMA
+    if name not in SCHEMAS:
+        raise ValueError(f"Unknown feature schema: {name!r} (expected one of {tuple(SCHEMAS)})")
+    return SCHEMAS[name]
+
+
+def save_schema(schema: FeatureSchema, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(schema.to_dict(), f, indent=2)
+    return path
+
+
+def load_schema(path: Path, default: FeatureSchema = LEGACY_SCHEMA) -> FeatureSchema:
+    """Schema stored at `path`; files written before schemas existed are legacy_v1."""
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return FeatureSchema.from_dict(json.load(f))
+
+
+def model_schema_path(model_path: Path) -> Path:
+    """models/isl_lstm.h5 -> models/isl_lstm.schema.json"""
+    model_path = Path(model_path)
+    return model_path.with_name(model_path.stem + ".schema.json")
+
+
+def load_model_schema(model_path: Path) -> FeatureSchema:
+    return load_schema(model_schema_path(model_path))
+
+
+def load_dataset_schema() -> FeatureSchema:
+    return load_schema(config.DATA_DIR / SCHEMA_FILENAME)
+
+
+def ensure_dataset_schema(schema: FeatureSchema):
+    """
+    Record `schema` as the dataset's layout, refusing to mix layouts: samples
+    extracted with different schemas cannot be trained on together.
+    """
+    path = config.DATA_DIR / SCHEMA_FILENAME
+    has_samples = any(config.DATA_DIR.glob("*/*.npy"))
+    current = load_dataset_schema() if (path.exists() or has_samples) else None
+    if current is not None and current != schema:
+        raise SystemExit(
+            f"Dataset in {config.DATA_DIR} uses feature schema {current.name!r}, not {schema.name!r}. "
+            "Use a separate DATA_DIR or re-extract the dataset."
+        )
+    save_schema(schema, path)
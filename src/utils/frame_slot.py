@@ -0,0 +1,61 @@
+"""
+Latest-frame-wins hand-off between a websocket's reader and its processor.
+
+Reading and processing a session's frames in one loop means that, once
+processing is slower than the client's frame rate, unread frames queue up in
+the socket buffers and every reply is for a frame seconds old. Instead a
+session runs two tasks around a FrameSlot:
+
+    reader:     while True: slot.put(await ws.receive())
+    processor:  while (frame := await slot.get()) is not None: process(frame)
+
+The slot holds at most one frame. A put() while the previous frame is still
+waiting replaces it and counts it as dropped, so a reply is never more than
+one frame (plus the one being processed) behind, and overload turns into a
+lower processed frame rate instead of a growing backlog.
+"""
+from __future__ import annotations
+
+import asyncio
+import collections
+from typing import Any, Optional
+
+
+class FrameSlot:
+    def __init__(self, totals: Optional[collections.Counter] = None):
+        self._frame: Any = None
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.received = 0
+        self.processed = 0
+        self.dropped = 0
+        # Server-wide counters, updated alongside the per-session ones
+        self.totals = totals if totals is not None else collections.Counter()
+
+    def put(self, frame: Any):
+        if self._frame is not None:
+            self.dropped += 1
+            self.totals["dropped"] += 1
+        self._frame = frame
+        self.received += 1
+        self.totals["received"] += 1
+        self._ready.set()
+
+    async def get(self) -> Optional[Any]:
+        """Newest frame not yet taken; None once the slot is closed."""
+        await self._ready.wait()
+        if self._closed:
+            return None
+        frame, self._frame = self._frame, None
+        self._ready.clear()
+        self.processed += 1
+        self.totals["processed"] += 1
+        return frame
+
+    def close(self):
+        """No more frames; a pending or later get() returns None (a waiting frame is discarded)."""
+        self._closed = True
+        self._ready.set()
+
+    def stats(self) -> dict:
+        return {"received": self.received, "processed": self.processed, "dropped": self.dropped}
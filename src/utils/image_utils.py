@@ -0,0 +1,109 @@
+"""
+Frame decoding and working-resolution helpers shared by the extractors and servers.
+
+Detection cost scales with pixel count, and MediaPipe's landmarks are
+normalized to the frame, so frames can be shrunk before detection without
+changing the output layout. For JPEG input the shrinking can start in the
+decoder: cv2.IMREAD_REDUCED_COLOR_{2,4,8} decodes at 1/2, 1/4 or 1/8 scale
+by skipping DCT coefficients, which is much cheaper than a full decode
+followed by a resize.
+"""
+from __future__ import annotations
+
+import base64
+from typing import Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+
+_REDUCED_COLOR = {2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
+# Start-of-frame markers (baseline, progressive, lossless, arithmetic); not DHT (C4), JPG (C8) or DAC (CC)
+_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """(width, height) from a JPEG's frame header, or None if `data` is not a JPEG."""
+    if data[:2] != b"\xff\xd8":
+        return None
+    i, n = 2, len(data)
+    while i + 9 < n:
+        if data[i] != 0xFF:
+            i += 1
+            continue
+        marker = data[i + 1]
+        if marker == 0xFF:
+            i += 1  # fill byte
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            i += 2  # standalone marker, no length
+            continue
+        if marker in _SOF_MARKERS:
+            height = (data[i + 5] << 8) | data[i + 6]
+            width = (data[i + 7] << 8) | data[i + 8]
+            return width, height
+        i += 2 + ((data[i + 2] << 8) | data[i + 3])
+    return None
+
+
+def reduction_factor(size: Tuple[int, int], max_side: int) -> int:
+    """Largest decoder reduction (1, 2, 4 or 8) that keeps the long side >= max_side."""
+    long_side = max(size)
+    for factor in (8, 4, 2):
+        if long_side // factor >= max_side:
+            return factor
+    return 1
+
+
+def decode_image(data: Union[bytes, memoryview], max_side: int = 0) -> Optional[np.ndarray]:
+    """
+    Decode an encoded image to BGR. With max_side > 0, JPEGs are decoded at
+    the smallest 1/2^k scale whose long side is still >= max_side; other
+    formats decode at full size. Returns None if the data cannot be decoded.
+    """
+    if len(data) == 0:
+        return None  # imdecode asserts on an empty buffer
+    flags = cv2.IMREAD_COLOR
+    if max_side > 0:
+        size = jpeg_size(data)
+        if size is not None:
+            flags = _REDUCED_COLOR.get(reduction_factor(size, max_side), cv2.IMREAD_COLOR)
+    try:
+        return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags)
+    except cv2.error:
+        return None
+
+
+def decode_data_url(image_b64: str, max_side: int = 0) -> Optional[np.ndarray]:
+    """decode_image() for a base64 payload, with or without a data: URL prefix."""
+    return decode_image(encoded_bytes(image_b64), max_side)
+
+
+def encoded_bytes(data: Union[bytes, memoryview, str]) -> Union[bytes, memoryview]:
+    """The encoded image of a payload: raw bytes as-is, base64 / data URL strings decoded."""
+    if isinstance(data, str):
+        return base64.b64decode(data.split(",")[-1])
+    return data
+
+
+def decode_payload(data: Union[bytes, memoryview, str], max_side: int = 0) -> Optional[np.ndarray]:
+    """Raw encoded bytes (binary protocol) or a base64 / data URL string (JSON protocol)."""
+    return decode_image(encoded_bytes(data), max_side)
+
+
+def to_working_resolution(image: np.ndarray, max_side: int = 0, downscale: float = 1.0) -> Tuple[np.ndarray, float]:
+    """
+    Shrink a frame to the working resolution before detection: by `downscale`,
+    and further so its long side is at most `max_side` (0 = no cap). Never
+    upscales. Returns the frame and the scale applied (working px / source px).
+
+    Normalized landmarks are resolution-independent and need no remapping;
+    pixel-space results (hand ROI boxes) are mapped back by dividing by the scale.
+    """
+    scale = min(1.0, downscale)
+    long_side = max(image.shape[:2])
+    if max_side > 0 and long_side * scale > max_side:
+        scale = max_side / long_side
+    if scale >= 1.0:
+        return image, 1.0
+    return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA), scale
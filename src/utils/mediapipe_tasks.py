@@ -0,0 +1,230 @@
+"""
+Landmark extraction on the MediaPipe Tasks API in LIVE_STREAM mode.
+
+HandLandmarker, FaceLandmarker and PoseLandmarker each take frames
+asynchronously (detect_async) and report through result callbacks on
+MediaPipe's own threads. TasksExtractor joins the three callbacks for a
+timestamp into the same feature-schema vector as HolisticExtractor, so a
+caller can hand over frame N+1 while frame N is still being processed.
+
+The .task model bundles are not shipped with the repo. Download them into
+config.MEDIAPIPE_TASKS_DIR (models/mediapipe/):
+    https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/latest/hand_landmarker.task
+    https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float16/latest/face_landmarker.task
+    https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_full/float16/latest/pose_landmarker_full.task
+The fast / accurate tracker profiles use pose_landmarker_lite.task /
+pose_landmarker_heavy.task from the same location instead.
+"""
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import Deque, Dict, List, Optional, Tuple
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from src import config
+from src.utils.feature_schema import FeatureSchema, get_schema
+from src.utils.image_utils import to_working_resolution
+from src.utils.tracker_profiles import TrackerProfile
+
+
+BaseOptions = mp.tasks.BaseOptions
+VisionRunningMode = mp.tasks.vision.RunningMode
+vision = mp.tasks.vision
+
+_PARTS = ("hands", "face", "pose")
+# Pose bundles by tracker profile complexity
+POSE_LANDMARKER_TASKS = ("pose_landmarker_lite.task", "pose_landmarker_full.task", "pose_landmarker_heavy.task")
+
+
+def _model_path(name: str) -> str:
+    path = config.MEDIAPIPE_TASKS_DIR / name
+    if not path.exists():
+        raise FileNotFoundError(f"MediaPipe task model not found: {path} (see src/utils/mediapipe_tasks.py)")
+    return str(path)
+
+
+def _hand_sort_key(handedness: List) -> int:
+    # Same slot order as the solutions backend: "Left" first, then "Right"
+    if not handedness:
+        return 2
+    return 0 if handedness[0].category_name.lower() == "left" else 1
+
+
+class TasksExtractor:
+    """
+    LIVE_STREAM extractor built on the three Tasks landmarkers.
+
+    submit() returns immediately; poll() drains finished vectors in frame
+    order (None for frames without a person). extract() is the blocking
+    convenience used where every frame matters.
+
+    Timestamps must increase per extractor; when omitted, a monotonic clock is
+    used. Under load MediaPipe may drop frames in LIVE_STREAM mode; those
+    never complete and are counted in `dropped_frames`. Drawing is not
+    supported on this backend.
+
+    A tracker `profile` sets the confidences, the pose bundle (lite / full /
+    heavy by pose complexity) and the input downscale; hand complexity and
+    the extraction rate do not apply to the Tasks landmarkers.
+    """
+
+    def __init__(
+        self,
+        static_image_mode: bool = False,
+        max_num_hands: int = 2,
+        wait_timeout: float = 1.0,
+        schema: Optional[FeatureSchema] = None,
+        profile: Optional[TrackerProfile] = None,
+        working_resolution: int = 0,
+    ):
+        # FaceLandmarker always returns the 478-point refined mesh
+        self.schema = schema or get_schema()
+        self.downscale = min(1.0, profile.downscale) if profile else 1.0
+        self.working_resolution = working_resolution
+        self.max_num_hands = max_num_hands
+        self.detection = profile.min_detection_confidence if profile else 0.5
+        self.tracking = profile.min_tracking_confidence if profile else 0.5
+        self.pose_task = POSE_LANDMARKER_TASKS[profile.pose_complexity] if profile else config.POSE_LANDMARKER_TASK
+        self.wait_timeout = wait_timeout
+        self._lock = threading.Condition()
+        self._pending: Dict[int, dict] = {}
+        self._completed: Deque[Tuple[int, Optional[np.ndarray]]] = collections.deque()
+        self._last_timestamp = -1
+        self.submitted_frames = 0
+        self.dropped_frames = 0
+
+        self._create_landmarkers()
+
+    def _create_landmarkers(self):
+        self.hands = vision.HandLandmarker.create_from_options(
+            vision.HandLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=_model_path(config.HAND_LANDMARKER_TASK)),
+                running_mode=VisionRunningMode.LIVE_STREAM,
+                num_hands=self.max_num_hands,
+                min_hand_detection_confidence=self.detection,
+                min_tracking_confidence=self.tracking,
+                result_callback=self._callback("hands"),
+            )
+        )
+        self.face_mesh = vision.FaceLandmarker.create_from_options(
+            vision.FaceLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=_model_path(config.FACE_LANDMARKER_TASK)),
+                running_mode=VisionRunningMode.LIVE_STREAM,
+                num_faces=1,
+                min_face_detection_confidence=self.detection,
+                min_tracking_confidence=self.tracking,
+                result_callback=self._callback("face"),
+            )
+        )
+        self.pose = vision.PoseLandmarker.create_from_options(
+            vision.PoseLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=_model_path(self.pose_task)),
+                running_mode=VisionRunningMode.LIVE_STREAM,
+                num_poses=1,
+                min_pose_detection_confidence=self.detection,
+                min_tracking_confidence=self.tracking,
+                result_callback=self._callback("pose"),
+            )
+        )
+
+    def _callback(self, part: str):
+        def on_result(result, output_image, timestamp_ms: int):
+            with self._lock:
+                parts = self._pending.get(timestamp_ms)
+                if parts is None:
+                    return  # frame already given up on
+                parts[part] = result
+                if len(parts) == len(_PARTS):
+                    self._finish(timestamp_ms, parts)
+
+        return on_result
+
+    def _finish(self, timestamp_ms: int, parts: dict):
+        """Pack a frame whose three results have arrived. Caller holds the lock."""
+        del self._pending[timestamp_ms]
+        # Callbacks arrive in timestamp order per landmarker, so anything older
+        # that is still pending was dropped by at least one of them
+        for stale in [ts for ts in self._pending if ts < timestamp_ms]:
+            del self._pending[stale]
+            self.dropped_frames += 1
+
+        hand_result, face_result, pose_result = parts["hands"], parts["face"], parts["pose"]
+        pairs = sorted(zip(hand_result.handedness, hand_result.hand_landmarks), key=lambda p: _hand_sort_key(p[0]))
+        hands = [landmarks for _, landmarks in pairs]
+        face = face_result.face_landmarks[0] if face_result.face_landmarks else None
+        pose = pose_result.pose_landmarks[0] if pose_result.pose_landmarks else None
+
+        out = np.empty(self.schema.num_features, dtype=np.float32)
+        vector = out if self.schema.pack(hands, face, pose, out) else None
+        self._completed.append((timestamp_ms, vector))
+        self._lock.notify_all()
+
+    def submit(self, image: np.ndarray, timestamp_ms: Optional[int] = None, draw: bool = False) -> int:
+        """Queue a BGR frame for extraction and return its timestamp."""
+        if timestamp_ms is None:
+            timestamp_ms = int(time.monotonic() * 1000)
+        timestamp_ms = max(timestamp_ms, self._last_timestamp + 1)
+        self._last_timestamp = timestamp_ms
+
+        image, _ = to_working_resolution(image, self.working_resolution, self.downscale)
+        rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+        with self._lock:
+            self._pending[timestamp_ms] = {}
+        self.submitted_frames += 1
+        self.hands.detect_async(mp_image, timestamp_ms)
+        self.face_mesh.detect_async(mp_image, timestamp_ms)
+        self.pose.detect_async(mp_image, timestamp_ms)
+        return timestamp_ms
+
+    def poll(self) -> List[Optional[np.ndarray]]:
+        """Vectors finished since the last poll, oldest first."""
+        with self._lock:
+            finished = [vector for _, vector in self._completed]
+            self._completed.clear()
+        return finished
+
+    def extract(self, image: np.ndarray, draw: bool = False) -> Optional[np.ndarray]:
+        """Submit a frame and block until its vector is ready (None if no person or dropped)."""
+        timestamp_ms = self.submit(image)
+        deadline = time.monotonic() + self.wait_timeout
+        with self._lock:
+            while True:
+                for i, (ts, vector) in enumerate(self._completed):
+                    if ts == timestamp_ms:
+                        del self._completed[i]
+                        return vector
+                remaining = deadline - time.monotonic()
+                if timestamp_ms not in self._pending or remaining <= 0:
+                    self._pending.pop(timestamp_ms, None)
+                    return None
+                self._lock.wait(remaining)
+
+    def reset(self):
+        """Forget frames in flight, finished vectors and tracks; timestamps keep increasing."""
+        # LIVE_STREAM graphs keep their tracks internally with no way to clear
+        # them, so a new stream gets fresh landmarkers
+        self.close()
+        with self._lock:
+            self._pending.clear()
+            self._completed.clear()
+        self._create_landmarkers()
+
+    def stats(self) -> dict:
+        return {"submitted_frames": self.submitted_frames, "dropped_frames": self.dropped_frames}
+
+    def close(self):
+        self.hands.close()
+        self.face_mesh.close()
+        self.pose.close()
+
+    def __enter__(self) -> "TasksExtractor":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import mediapipe as mp
 import numpy as np
-from typing import Optional, Tuple, List
+from typing import Deque, Optional, Tuple, List
 
 from src import config
+from src.utils.feature_schema import (
+    HAND_POINTS,
+    LEGACY_SCHEMA,
+    UPPER_BODY_INDICES,
+    FeatureSchema,
+    get_schema,
+    write_xyz,
+)
+from src.utils.image_utils import to_working_resolution
+from src.utils.profiling import PROFILER
+from src.utils.tracker_profiles import TrackerProfile
 
 
 mp_hands = mp.solutions.hands
@@ -15,32 +29,49 @@ mp_drawing = mp.solutions.drawing_utils
 mp_drawing_styles = mp.solutions.drawing_styles
 
 
-def create_hand_tracker(static_image_mode: bool = False, max_num_hands: int = 2):
+def create_hand_tracker(
+    static_image_mode: bool = False,
+    max_num_hands: int = 2,
+    model_complexity: int = 1,  # 0=fast, 1=full
+    min_detection_confidence: float = 0.5,
+    min_tracking_confidence: float = 0.5,
+):
     return mp_hands.Hands(
         static_image_mode=static_image_mode,
         max_num_hands=max_num_hands,
-        min_detection_confidence=0.5,
-        min_tracking_confidence=0.5,
+        model_complexity=model_complexity,
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
     )
 
 
-def create_face_tracker(static_image_mode: bool = False):
+def create_face_tracker(
+    static_image_mode: bool = False,
+    refine_landmarks: bool = True,
+    min_detection_confidence: float = 0.5,
+    min_tracking_confidence: float = 0.5,
+):
     return mp_face_mesh.FaceMesh(
         static_image_mode=static_image_mode,
         max_num_faces=1,
-        refine_landmarks=True,  # Get more detailed landmarks
-        min_detection_confidence=0.5,
-        min_tracking_confidence=0.5,
+        refine_landmarks=refine_landmarks,  # 478 points incl. irises (only legacy_v1 needs them)
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
     )
 
 
-def create_pose_tracker(static_image_mode: bool = False):
+def create_pose_tracker(
+    static_image_mode: bool = False,
+    model_complexity: int = 1,  # 0=fast, 1=balanced, 2=accurate
+    min_detection_confidence: float = 0.5,
+    min_tracking_confidence: float = 0.5,
+):
     return mp_pose.Pose(
         static_image_mode=static_image_mode,
-        model_complexity=1,  # 0=fast, 1=balanced, 2=accurate
+        model_complexity=model_complexity,
         enable_segmentation=False,
-        min_detection_confidence=0.5,
-        min_tracking_confidence=0.5,
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
     )
 
 
@@ -55,7 +86,11 @@ def extract_face_landmarks(
     """
     rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
     results = face_mesh.process(rgb)
+    return face_landmarks_from_results(image, results, draw=draw)
+
 
+def face_landmarks_from_results(image: np.ndarray, results, draw: bool = False) -> Optional[np.ndarray]:
+    """Flatten a FaceMesh result (see extract_face_landmarks)."""
     if not results.multi_face_landmarks:
         return None
 
@@ -88,25 +123,15 @@ def extract_hand_landmarks(
     """
     rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
     results = hands.process(rgb)
+    return hand_landmarks_from_results(image, results, draw=draw)
 
+
+def hand_landmarks_from_results(image: np.ndarray, results, draw: bool = False) -> Optional[np.ndarray]:
+    """Flatten a Hands result (see extract_hand_landmarks)."""
     if not results.multi_hand_landmarks:
         return None
 
-    # Pair handedness with landmarks so we can keep a consistent ordering
-    hands_list: List = list(results.multi_hand_landmarks)
-    handedness_list: List = list(getattr(results, "multi_handedness", []))
-
-    pairs = list(zip(handedness_list, hands_list)) if handedness_list else [(None, h) for h in hands_list]
-
-    # Sort so index 0 is always "Left", index 1 is "Right" when available
-    def sort_key(item):
-        h, _ = item
-        if h is None:
-            return 2
-        label = h.classification[0].label
-        return 0 if label.lower() == "left" else 1
-
-    pairs.sort(key=sort_key)
+    pairs = _ordered_hands(results)
 
     all_coords = []
     drawn = 0
@@ -126,6 +151,25 @@ def extract_hand_landmarks(
     return landmarks
 
 
+def _hand_sort_key(item):
+    h, _ = item
+    if h is None:
+        return 2
+    label = h.classification[0].label
+    return 0 if label.lower() == "left" else 1
+
+
+def _ordered_hands(results) -> List:
+    """(handedness, landmarks) pairs sorted so index 0 is "Left", index 1 is "Right"."""
+    # Pair handedness with landmarks so we can keep a consistent ordering
+    hands_list: List = list(results.multi_hand_landmarks)
+    handedness_list: List = list(getattr(results, "multi_handedness", []) or [])
+
+    pairs = list(zip(handedness_list, hands_list)) if handedness_list else [(None, h) for h in hands_list]
+    pairs.sort(key=_hand_sort_key)
+    return pairs
+
+
 def extract_pose_upper_body_landmarks(
     image: np.ndarray,
     pose: mp_pose.Pose,
@@ -145,16 +189,14 @@ def extract_pose_upper_body_landmarks(
     """
     rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
     results = pose.process(rgb)
+    return pose_landmarks_from_results(image, results, draw=draw)
 
+
+def pose_landmarks_from_results(image: np.ndarray, results, draw: bool = False) -> Optional[np.ndarray]:
+    """Flatten a Pose result to the upper body subset (see extract_pose_upper_body_landmarks)."""
     if not results.pose_landmarks:
         return None
 
-    # Upper body key point indices for ISL
-    UPPER_BODY_INDICES = [0, 2, 5, 7, 8, 11, 12, 13, 14, 15, 16]
-    # 0=nose, 2=left_eye, 5=right_eye, 7=left_ear, 8=right_ear
-    # 11=left_shoulder, 12=right_shoulder, 13=left_elbow, 14=right_elbow
-    # 15=left_wrist, 16=right_wrist
-
     if draw:
         mp_drawing.draw_landmarks(
             image,
@@ -189,7 +231,18 @@ def extract_combined_landmarks(
     hand_lm = extract_hand_landmarks(image, hands, draw=draw)
     face_lm = extract_face_landmarks(image, face_mesh, draw=draw)
     pose_lm = extract_pose_upper_body_landmarks(image, pose, draw=draw)
+    return combine_landmarks(hand_lm, face_lm, pose_lm)
 
+
+def combine_landmarks(
+    hand_lm: Optional[np.ndarray],
+    face_lm: Optional[np.ndarray],
+    pose_lm: Optional[np.ndarray],
+) -> Optional[np.ndarray]:
+    """
+    Join per-tracker landmarks into the NUM_LANDMARKS vector used by the LSTM.
+    Returns None when there is no pose (no person in the frame).
+    """
     # Require pose detection to ensure there's actually a person in the frame
     # This prevents false positives from hands/face when no person is present
     if pose_lm is None:
@@ -216,6 +269,420 @@ def extract_combined_landmarks(
     return combined
 
 
+def pack_combined_landmarks(
+    hand_results,
+    face_results,
+    pose_results,
+    out: np.ndarray,
+    schema: FeatureSchema = LEGACY_SCHEMA,
+) -> bool:
+    """
+    Write hands, face and upper body pose straight into a preallocated
+    float32 buffer of schema.num_features values. No per-landmark lists or
+    concatenation; missing blocks are left as zeros.
+
+    With the default legacy_v1 schema the layout matches combine_landmarks()
+    exactly (see feature_schema.py for its truncation quirk).
+    hand_results may be None when the caller writes the hand block itself
+    (see HolisticExtractor with hand_roi=True).
+    Returns False (buffer zeroed) if no pose was detected.
+    """
+    hands = []
+    if hand_results is not None and hand_results.multi_hand_landmarks:
+        hands = [h_landmarks.landmark for _, h_landmarks in _ordered_hands(hand_results)]
+    face = face_results.multi_face_landmarks[0].landmark if face_results.multi_face_landmarks else None
+    pose = pose_results.pose_landmarks.landmark if pose_results.pose_landmarks else None
+    return schema.pack(hands, face, pose, out)
+
+
+# Pose (wrist, elbow) indices used to place a hand crop for each arm
+HAND_ROI_JOINTS = ((15, 13), (16, 14))
+HAND_ROI_MIN_VISIBILITY = 0.3
+HAND_ROI_MIN_SIDE = 96  # pixels
+
+
+def hand_roi_from_pose(pose_landmarks, wrist_idx: int, elbow_idx: int, width: int, height: int):
+    """
+    Square crop box (x0, y0, x1, y1) in pixels around the hand at the end of
+    one forearm, or None if the wrist is not visible.
+    The box is centred a little past the wrist along the elbow->wrist direction
+    and sized from the forearm length so spread fingers still fit.
+    """
+    wrist = pose_landmarks[wrist_idx]
+    elbow = pose_landmarks[elbow_idx]
+    if wrist.visibility < HAND_ROI_MIN_VISIBILITY:
+        return None
+
+    wx, wy = wrist.x * width, wrist.y * height
+    dx, dy = wx - elbow.x * width, wy - elbow.y * height
+    forearm = (dx * dx + dy * dy) ** 0.5
+    cx, cy = wx + 0.4 * dx, wy + 0.4 * dy
+    side = int(min(max(2.0 * forearm, HAND_ROI_MIN_SIDE), min(width, height)))
+
+    x0 = int(min(max(cx - side / 2, 0), width - side))
+    y0 = int(min(max(cy - side / 2, 0), height - side))
+    return x0, y0, x0 + side, y0 + side
+
+
+def _stable_roi(previous, current):
+    """Keep the previous box while the hand stays inside it, so hand tracking stays locked."""
+    if previous is None or current is None:
+        return current
+    px0, py0, px1, py1 = previous
+    cx0, cy0, cx1, cy1 = current
+    prev_side, side = px1 - px0, cx1 - cx0
+    shift = max(abs((cx0 + cx1) - (px0 + px1)), abs((cy0 + cy1) - (py0 + py1))) / 2
+    if shift < 0.2 * prev_side and 0.8 < side / prev_side < 1.25:
+        return previous
+    return current
+
+
+def draw_results(image: np.ndarray, hand_results, face_results, pose_results):
+    """Draw tracker results on a BGR frame, in the same order as extract_combined_landmarks."""
+    if hand_results is not None and hand_results.multi_hand_landmarks:
+        for _, h_landmarks in _ordered_hands(hand_results)[:2]:
+            mp_drawing.draw_landmarks(image, h_landmarks, mp_hands.HAND_CONNECTIONS)
+    if face_results.multi_face_landmarks:
+        mp_drawing.draw_landmarks(
+            image,
+            face_results.multi_face_landmarks[0],
+            mp_face_mesh.FACEMESH_CONTOURS,
+            None,
+            mp_drawing_styles.get_default_face_mesh_contours_style(),
+        )
+    if pose_results.pose_landmarks:
+        mp_drawing.draw_landmarks(
+            image,
+            pose_results.pose_landmarks,
+            mp_pose.POSE_CONNECTIONS,
+            mp_drawing_styles.get_default_pose_landmarks_style(),
+        )
+
+
+class MotionGate:
+    """
+    Cheap "did anything move?" check on a tiny grayscale thumbnail.
+
+    Each frame is compared with the last frame that was actually processed
+    (not the previous frame), so slow drift still trips the gate eventually.
+    After max_reuse consecutive static frames the gate opens anyway to keep
+    the carried landmarks from going stale.
+    """
+
+    def __init__(self, threshold: float, size: Tuple[int, int] = (32, 24), max_reuse: int = 15):
+        self.threshold = threshold
+        self.size = size
+        self.max_reuse = max_reuse
+        self._reference: Optional[np.ndarray] = None
+        self._run = 0
+        self.checked_frames = 0
+        self.static_frames = 0
+
+    def is_static(self, image: np.ndarray) -> bool:
+        """True if `image` differs from the reference by less than the threshold (mean abs, 0-255)."""
+        self.checked_frames += 1
+        thumb = cv2.cvtColor(cv2.resize(image, self.size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        if (
+            self._reference is not None
+            and self._run < self.max_reuse
+            and cv2.norm(thumb, self._reference, cv2.NORM_L1) / thumb.size < self.threshold
+        ):
+            self._run += 1
+            self.static_frames += 1
+            return True
+        self._reference = thumb
+        self._run = 0
+        return False
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.static_frames / self.checked_frames if self.checked_frames else 0.0
+
+    def reset(self):
+        self._reference = None
+        self._run = 0
+
+
+class HolisticExtractor:
+    """
+    Owns a hands / face mesh / pose tracker triple and extracts the combined
+    landmark vector from a frame.
+
+    The frame is converted to RGB once and the three trackers run side by side:
+    pose on the calling thread, hands and face mesh on a small thread pool
+    (MediaPipe releases the GIL inside .process()). The output is identical to
+    extract_combined_landmarks().
+
+    extract_into() packs the result into a caller-owned buffer, which lets
+    streaming callers reuse one array per frame slot.
+
+    With gate_on_pose=True, pose runs first and hands / face mesh are skipped
+    entirely when nobody is in the frame (the frame would be discarded anyway).
+    This trades a little latency on occupied frames for near-zero cost on empty
+    ones; skipped frames are counted in `skipped_frames`.
+
+    With hand_roi=True (implies pose first), hand landmarks run on square crops
+    around each wrist placed from the pose elbow/wrist points, one single-hand
+    tracker per arm, and are mapped back to full-frame normalized coordinates.
+    The 126-value hand block keeps its Left/Right slot order.
+
+    pose_every / face_every run those trackers only on every Nth frame; in
+    between, their last results are carried forward so every frame still
+    yields a full vector. Hands always run, since they carry most of the
+    signal. With pose gating, a carried pose also decides person presence.
+
+    motion_threshold > 0 puts a MotionGate in front of everything: when the
+    frame has barely changed since the last processed one, the previous
+    vector is returned without running any tracker. See stats() for the
+    reuse ratio.
+
+    submit() / poll() mirror the asynchronous TasksExtractor interface; here
+    submit() simply extracts synchronously and queues the result.
+
+    `schema` (default: config.FEATURE_SCHEMA) sets the vector layout; iris
+    refinement is enabled when the schema needs those points or the tracker
+    profile asks for it.
+
+    `profile` sets tracker complexity and confidences (see tracker_profiles).
+    Detection runs at a working resolution: the frame is scaled by
+    `downscale` and capped to `working_resolution` pixels on its long side
+    (see to_working_resolution). The output layout is unaffected; ROI crops
+    are mapped back to source-frame coordinates.
+    """
+
+    def __init__(
+        self,
+        static_image_mode: bool = False,
+        max_num_hands: int = 2,
+        gate_on_pose: bool = False,
+        hand_roi: bool = False,
+        pose_every: int = 1,
+        face_every: int = 1,
+        motion_threshold: float = 0.0,
+        schema: Optional[FeatureSchema] = None,
+        profile: Optional[TrackerProfile] = None,
+        downscale: float = 1.0,
+        working_resolution: int = 0,
+    ):
+        self.schema = schema or get_schema()
+        self.profile = profile or TrackerProfile("default")
+        confidences = dict(
+            min_detection_confidence=self.profile.min_detection_confidence,
+            min_tracking_confidence=self.profile.min_tracking_confidence,
+        )
+        hand_options = dict(model_complexity=self.profile.hand_complexity, **confidences)
+        if hand_roi:
+            # One single-hand tracker per arm so each keeps tracking its own crop
+            self.hands = None
+            self.roi_hands = [
+                create_hand_tracker(static_image_mode, max_num_hands=1, **hand_options) for _ in HAND_ROI_JOINTS
+            ]
+            self._roi_boxes = [None] * len(HAND_ROI_JOINTS)
+        else:
+            self.hands = create_hand_tracker(
+                static_image_mode=static_image_mode, max_num_hands=max_num_hands, **hand_options
+            )
+            self.roi_hands = []
+        self.hand_roi = hand_roi
+        self.face_mesh = create_face_tracker(
+            static_image_mode=static_image_mode,
+            refine_landmarks=self.schema.refine_face or self.profile.refine_face,
+            **confidences,
+        )
+        self.pose = create_pose_tracker(
+            static_image_mode=static_image_mode, model_complexity=self.profile.pose_complexity, **confidences
+        )
+        self.downscale = min(1.0, downscale)
+        self.working_resolution = working_resolution
+        self.gate_on_pose = gate_on_pose
+        self.pose_every = max(1, pose_every)
+        self.face_every = max(1, face_every)
+        self._frame_index = 0
+        self._pose_results = None
+        self._face_results = None
+        self.motion_gate = MotionGate(motion_threshold) if motion_threshold > 0 else None
+        self._last_vector = np.zeros(self.schema.num_features, dtype=np.float32)
+        self._last_present = False
+        self._last_drawn = None
+        self._completed: Deque[Optional[np.ndarray]] = collections.deque()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mediapipe")
+        self.processed_frames = 0
+        self.skipped_frames = 0
+
+    def reset(self):
+        """
+        Forget all temporal state (tracker graphs, carried results, ROI boxes,
+        motion gate, queued vectors) so the next frame starts a new stream.
+        Counters are kept.
+        """
+        trackers = [self.hands, self.face_mesh, self.pose, *self.roi_hands]
+        for tracker in trackers:
+            if tracker is not None:
+                tracker.reset()
+        self._frame_index = 0
+        self._pose_results = None
+        self._face_results = None
+        if self.hand_roi:
+            self._roi_boxes = [None] * len(HAND_ROI_JOINTS)
+        if self.motion_gate is not None:
+            self.motion_gate.reset()
+        self._last_vector.fill(0.0)
+        self._last_present = False
+        self._last_drawn = None
+        self._completed.clear()
+
+    def stats(self) -> dict:
+        stats = {"processed_frames": self.processed_frames, "skipped_frames": self.skipped_frames}
+        if self.motion_gate is not None:
+            stats["reused_frames"] = self.motion_gate.static_frames
+            stats["reuse_ratio"] = self.motion_gate.reuse_ratio
+        return stats
+
+    def extract(self, image: np.ndarray, draw: bool = False) -> Optional[np.ndarray]:
+        out = np.empty(self.schema.num_features, dtype=np.float32)
+        return out if self.extract_into(image, out, draw=draw) else None
+
+    def submit(self, image: np.ndarray, timestamp_ms: Optional[int] = None, draw: bool = False):
+        self._completed.append(self.extract(image, draw=draw))
+
+    def poll(self) -> List[Optional[np.ndarray]]:
+        finished = list(self._completed)
+        self._completed.clear()
+        return finished
+
+    def extract_into(self, image: np.ndarray, out: np.ndarray, draw: bool = False) -> bool:
+        """Fill `out` (float32, schema.num_features) in place. Returns False if no person was found."""
+        with PROFILER.stage("extract"):
+            if self.motion_gate is not None:
+                with PROFILER.stage("motion_gate"):
+                    static = self.motion_gate.is_static(image)
+                if static:
+                    out[:] = self._last_vector
+                    if draw and self._last_drawn is not None:
+                        self._draw(image, *self._last_drawn)
+                    return self._last_present
+                self._last_present = self._extract_into(image, out, draw)
+                self._last_vector[:] = out
+                return self._last_present
+            return self._extract_into(image, out, draw)
+
+    def _extract_into(self, image: np.ndarray, out: np.ndarray, draw: bool) -> bool:
+        with PROFILER.stage("resize"):
+            small, scale = to_working_resolution(image, self.working_resolution, self.downscale)
+        with PROFILER.stage("color"):
+            rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+        # Read-only input lets MediaPipe use the buffer without copying it
+        rgb.flags.writeable = False
+        self.processed_frames += 1
+
+        run_pose = self._is_due(self.pose_every, self._pose_results)
+        run_face = self._is_due(self.face_every, self._face_results)
+        self._frame_index += 1
+
+        roi_hands = []
+        if self.gate_on_pose or self.hand_roi:
+            if run_pose:
+                self._pose_results = PROFILER.timed("pose", self.pose.process, rgb)
+            if not self._pose_results.pose_landmarks:
+                # No person: hands / face would be thrown away, don't run them
+                self.skipped_frames += 1
+                self._last_drawn = None
+                # Whoever shows up next gets a fresh face mesh on their first frame
+                self._face_results = None
+                out.fill(0.0)
+                return False
+            face_future = self._submit_face(rgb) if run_face else None
+            if self.hand_roi:
+                hand_results = None
+                roi_hands = PROFILER.timed(
+                    "hands", self._process_hand_rois, rgb, self._pose_results.pose_landmarks.landmark, scale
+                )
+            else:
+                hand_results = PROFILER.timed("hands", self.hands.process, rgb)
+        else:
+            hand_future = self._executor.submit(PROFILER.timed, "hands", self.hands.process, rgb)
+            face_future = self._submit_face(rgb) if run_face else None
+            if run_pose:
+                self._pose_results = PROFILER.timed("pose", self.pose.process, rgb)
+            hand_results = hand_future.result()
+        if face_future is not None:
+            self._face_results = face_future.result()
+        face_results, pose_results = self._face_results, self._pose_results
+
+        # Drawing mutates the BGR frame, so it stays on the calling thread
+        self._last_drawn = (hand_results, face_results, pose_results, roi_hands)
+        if draw:
+            with PROFILER.stage("draw"):
+                self._draw(image, *self._last_drawn)
+        with PROFILER.stage("pack"):
+            present = pack_combined_landmarks(hand_results, face_results, pose_results, out, self.schema)
+            if present and roi_hands:
+                self._pack_hand_rois(roi_hands, out, image.shape[1], image.shape[0])
+        return present
+
+    def _submit_face(self, rgb: np.ndarray):
+        return self._executor.submit(PROFILER.timed, "face", self.face_mesh.process, rgb)
+
+    def _draw(self, image: np.ndarray, hand_results, face_results, pose_results, roi_hands: List):
+        draw_results(image, hand_results, face_results, pose_results)
+        for box, h_landmarks, _ in roi_hands:
+            x0, y0, x1, y1 = (int(round(v)) for v in box)
+            mp_drawing.draw_landmarks(image[y0:y1, x0:x1], h_landmarks, mp_hands.HAND_CONNECTIONS)
+
+    def _is_due(self, every: int, cached) -> bool:
+        """Whether a tracker scheduled every `every` frames runs on the current frame."""
+        return cached is None or self._frame_index % every == 0
+
+    def _process_hand_rois(self, rgb: np.ndarray, pose_landmarks, scale: float = 1.0) -> List:
+        """
+        Run each arm's hand tracker on its crop; returns [(box, landmarks, handedness)]
+        with boxes mapped back to source-frame pixels (working-resolution box / scale).
+        """
+        height, width = rgb.shape[:2]
+        found = []
+        for i, (wrist_idx, elbow_idx) in enumerate(HAND_ROI_JOINTS):
+            box = hand_roi_from_pose(pose_landmarks, wrist_idx, elbow_idx, width, height)
+            box = self._roi_boxes[i] = _stable_roi(self._roi_boxes[i], box)
+            if box is None:
+                continue
+            x0, y0, x1, y1 = box
+            results = self.roi_hands[i].process(np.ascontiguousarray(rgb[y0:y1, x0:x1]))
+            if results.multi_hand_landmarks:
+                handedness = (results.multi_handedness or [None])[0]
+                source_box = tuple(v / scale for v in box)
+                found.append((source_box, results.multi_hand_landmarks[0], handedness))
+        return found
+
+    def _pack_hand_rois(self, hands: List, out: np.ndarray, width: int, height: int):
+        """Write crop-space hand landmarks into the hand block, remapped to full-frame coordinates."""
+        # Same Left/Right slot order as the full-frame path
+        ordered = sorted(hands, key=lambda item: _hand_sort_key((item[2], None)))
+        for slot, ((x0, y0, x1, y1), h_landmarks, _) in enumerate(ordered[:2]):
+            offset = self.schema.hand_offset + slot * HAND_POINTS * 3
+            write_xyz(out, offset, h_landmarks.landmark, HAND_POINTS)
+            block = out[offset : offset + HAND_POINTS * 3].reshape(HAND_POINTS, 3)
+            side = x1 - x0
+            block[:, 0] = (x0 + block[:, 0] * side) / width
+            block[:, 1] = (y0 + block[:, 1] * (y1 - y0)) / height
+            # Hand z shares the crop's x scale
+            block[:, 2] *= side / width
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        if self.hands is not None:
+            self.hands.close()
+        for tracker in self.roi_hands:
+            tracker.close()
+        self.face_mesh.close()
+        self.pose.close()
+
+    def __enter__(self) -> "HolisticExtractor":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 def draw_info(frame: np.ndarray, text: str, color=(0, 255, 0)):
     cv2.putText(frame, text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
 
@@ -0,0 +1,89 @@
+"""
+Prometheus text exposition for the recognition servers' GET /metrics.
+
+Nothing here sits on the hot path. Stage latencies are the StageProfiler
+histograms (per-thread shards, no lock per observation), and counters are
+the plain ints the servers already keep on their event loop (or under a
+lock where a sync endpoint counts too). The writes are only gathered when
+/metrics is scraped, so one scrape may mix values from a few microseconds
+apart, which Prometheus tolerates.
+
+    text = MetricsText()
+    text.stage_histograms(PROFILER)
+    text.add("isl_sessions_active", "gauge", "Open websocket sessions", active)
+    return PlainTextResponse(text.render(), media_type=CONTENT_TYPE)
+"""
+from __future__ import annotations
+
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from src.utils.profiling import Histogram, StageProfiler
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Mapping[str, str]
+Samples = Union[float, Iterable[Tuple[Labels, float]]]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def executor_queue_depth(executor: Optional[Executor]) -> int:
+    """Tasks submitted to `executor` and not yet started (0 if it doesn't say)."""
+    # Private attributes: fall back to 0 rather than break /metrics if CPython renames them
+    if isinstance(executor, ThreadPoolExecutor):
+        work_queue = getattr(executor, "_work_queue", None)
+        return work_queue.qsize() if work_queue is not None else 0
+    if isinstance(executor, ProcessPoolExecutor):
+        return len(getattr(executor, "_pending_work_items", ()))
+    return 0
+
+
+class MetricsText:
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def add(self, name: str, kind: str, help: str, samples: Samples):
+        """One metric family: a single value, or (labels, value) pairs."""
+        self._lines.append(f"# HELP {name} {help}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        if isinstance(samples, (int, float)):
+            samples = [({}, samples)]
+        for labels, value in samples:
+            self._lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def histogram(self, name: str, help: str, histograms: Mapping[str, Histogram], label: str = ""):
+        """Histogram family from Histogram objects, keyed by the value of `label` (one unlabeled if label is "")."""
+        self._lines.append(f"# HELP {name} {help}")
+        self._lines.append(f"# TYPE {name} histogram")
+        for key, hist in histograms.items():
+            labels: Dict[str, str] = {label: key} if label else {}
+            cumulative = 0
+            for bound, count in zip(list(hist.bounds) + [math.inf], hist.counts):
+                cumulative += count
+                le = "+Inf" if math.isinf(bound) else f"{bound:.6g}"
+                self._lines.append(f"{name}_bucket{_format_labels({**labels, 'le': le})} {cumulative}")
+            self._lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(hist.total)}")
+            self._lines.append(f"{name}_count{_format_labels(labels)} {hist.count}")
+
+    def stage_histograms(self, profiler: StageProfiler, name: str = "isl_stage_duration_seconds"):
+        """Per-stage latency (decode, extract, predict, send, ...) recorded by `profiler`."""
+        self.histogram(name, "Time spent per pipeline stage", dict(sorted(profiler.histograms().items())), "stage")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
@@ -0,0 +1,111 @@
+"""
+Client (and wire format) for the shared model-serving process, src/model_server.py.
+
+`uvicorn src.server:app --workers N` would otherwise import TensorFlow and
+load the model N times. With ISL_MODEL_SERVER=<socket path> the web workers
+load neither; they send their (micro-batched) windows over a Unix socket to
+one model process, which batches across all of them.
+
+Wire format, little-endian, one request in flight per connection:
+
+    request   uint32 windows (1-MAX_WINDOWS), uint32 timesteps, uint32 features,
+              then windows*timesteps*features float32
+    reply     uint32 rows, uint32 classes, then rows*classes float32
+    error     uint32 ERROR, uint32 n, then an n-byte UTF-8 message
+"""
+from __future__ import annotations
+
+import socket
+import struct
+import threading
+from typing import Optional
+
+import numpy as np
+
+REQUEST = struct.Struct("<III")
+REPLY = struct.Struct("<II")
+ERROR = 0xFFFFFFFF
+# Most windows in one request; the client splits bigger batches
+MAX_WINDOWS = 1024
+
+
+class ModelServerError(RuntimeError):
+    """The model server rejected or failed a request."""
+
+
+def recv_exact(sock: socket.socket, size: int) -> bytearray:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if not n:
+            raise ConnectionError("Model server closed the connection")
+        received += n
+    return buf
+
+
+class ModelClient:
+    """
+    Blocking, thread-safe client: predict() is called from executor threads
+    (BatchScheduler, the sync /predict endpoint) and requests on the one
+    connection are serialized. A broken connection is re-opened once per call;
+    a timed-out request is not resent.
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = 30.0):
+        self.path = path
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        return sock
+
+    def predict(self, windows: np.ndarray) -> np.ndarray:
+        """Class probabilities for a (batch, timesteps, features) array of windows."""
+        windows = np.ascontiguousarray(windows, dtype="<f4")
+        if len(windows) > MAX_WINDOWS:
+            return np.concatenate(
+                [self._request(windows[i : i + MAX_WINDOWS]) for i in range(0, len(windows), MAX_WINDOWS)]
+            )
+        return self._request(windows)
+
+    def _request(self, windows: np.ndarray) -> np.ndarray:
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    sock = self._sock or self._connect()
+                    sock.sendall(REQUEST.pack(*windows.shape))
+                    sock.sendall(windows)
+                    rows, cols = REPLY.unpack(recv_exact(sock, REPLY.size))
+                    if rows == ERROR:
+                        raise ModelServerError(recv_exact(sock, cols).decode("utf-8", "replace"))
+                    return np.frombuffer(recv_exact(sock, rows * cols * 4), dtype="<f4").reshape(rows, cols)
+                except ConnectionError:
+                    # Stale connection (server restarted): reconnect and send once more
+                    self._close()
+                    if attempt:
+                        raise
+                except OSError:
+                    # Timeouts included: the server may still be working on the
+                    # batch, and resending it would only double its load
+                    self._close()
+                    raise
+
+    def _close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def close(self):
+        with self._lock:
+            self._close()
@@ -0,0 +1,189 @@
+"""
+Low-overhead per-stage timing for the extraction and serving hot paths.
+
+Stages are timed with time.perf_counter() and recorded into fixed-bucket
+histograms (log-spaced, 0.1 ms to ~1 s), so recording is a bisect and three
+increments with no allocation. Each thread writes to its own shard of
+histograms, so the MediaPipe executor threads and the server's worker threads
+never contend on a lock; readers merge the shards on demand, folding the
+shards of threads that have exited (to_thread helpers, restarted pools) into
+one retired set so they don't pile up.
+
+Profiling is off by default in scripts (config.PROFILE_PIPELINE /
+ISL_PROFILE=1); the servers switch it on for GET /metrics unless ISL_METRICS=0.
+It can be switched at runtime with PROFILER.enabled; when off, PROFILER.stage()
+returns a shared no-op context manager.
+
+    with PROFILER.stage("decode"):
+        frame = cv2.imdecode(...)
+    future = executor.submit(PROFILER.timed, "hands", hands.process, rgb)
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+import weakref
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from src import config
+
+
+# Upper bucket bounds in seconds: 0.1 ms * sqrt(2)^i, up to ~1.16 s
+DEFAULT_BOUNDS = tuple(0.0001 * 2 ** (i / 2) for i in range(28))
+
+_NULL_STAGE = nullcontext()
+
+
+class Histogram:
+    """Cumulative-friendly bucket counts (value <= bound) plus sum and count."""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last bucket is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: "Histogram"):
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.total += other.total
+        self.count += other.count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate by linear interpolation inside the bucket holding the q-th value."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.bounds[-1]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "StageProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.observe(self.name, time.perf_counter() - self.start)
+
+
+class StageProfiler:
+    def __init__(self, enabled: bool = False, bounds: Sequence[float] = DEFAULT_BOUNDS):
+        self.enabled = enabled
+        self.bounds = tuple(bounds)
+        self._local = threading.local()
+        self._lock = threading.Lock()  # only taken when a thread first records, and by readers
+        # (owning thread, its shard); the weakref lets readers spot threads that are gone
+        self._shards: List[Tuple[weakref.ref, Dict[str, Histogram]]] = []
+        self._retired: Dict[str, Histogram] = {}
+
+    def _shard(self) -> Dict[str, Histogram]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+        return shard
+
+    def _retire_dead(self):
+        """Fold shards of exited threads into the retired histograms. Caller holds the lock."""
+        live = []
+        for thread_ref, shard in self._shards:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                live.append((thread_ref, shard))
+                continue
+            # The thread is gone, so nothing writes to this shard any more
+            for stage, hist in shard.items():
+                self._retired.setdefault(stage, Histogram(self.bounds)).merge(hist)
+        self._shards = live
+
+    def observe(self, stage: str, seconds: float):
+        shard = self._shard()
+        hist = shard.get(stage)
+        if hist is None:
+            hist = shard[stage] = Histogram(self.bounds)
+        hist.observe(seconds)
+
+    def stage(self, name: str):
+        """Context manager timing its body into `name` (no-op when disabled)."""
+        return _Stage(self, name) if self.enabled else _NULL_STAGE
+
+    def timed(self, name: str, fn: Callable, *args):
+        """fn(*args), timed into `name`; for work handed to executors."""
+        if not self.enabled:
+            return fn(*args)
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def histograms(self) -> Dict[str, Histogram]:
+        """All shards merged per stage."""
+        merged: Dict[str, Histogram] = {}
+        with self._lock:
+            self._retire_dead()
+            # Retired histograms only change under the lock, so merge them here
+            for stage, hist in self._retired.items():
+                merged.setdefault(stage, Histogram(self.bounds)).merge(hist)
+            shards = [shard for _, shard in self._shards]
+        for shard in shards:
+            for stage, hist in list(shard.items()):
+                merged.setdefault(stage, Histogram(self.bounds)).merge(hist)
+        return merged
+
+    def snapshot(self) -> Dict[str, dict]:
+        """{stage: {count, mean_ms, p50_ms, p95_ms, p99_ms}}"""
+        return {
+            stage: {
+                "count": hist.count,
+                "mean_ms": hist.mean * 1000,
+                "p50_ms": hist.quantile(0.50) * 1000,
+                "p95_ms": hist.quantile(0.95) * 1000,
+                "p99_ms": hist.quantile(0.99) * 1000,
+            }
+            for stage, hist in sorted(self.histograms().items())
+        }
+
+    def summary_lines(self) -> List[str]:
+        """One 'stage  mean / p95' line per stage, for on-screen overlays."""
+        return [
+            f"{stage:12s} {row['mean_ms']:6.1f} ms  p95 {row['p95_ms']:6.1f}"
+            for stage, row in self.snapshot().items()
+        ]
+
+    def reset(self):
+        with self._lock:
+            self._retired.clear()
+            for _, shard in self._shards:
+                shard.clear()
+
+
+# Process-wide profiler shared by the extractors, inference and the server
+PROFILER = StageProfiler(enabled=config.PROFILE_PIPELINE)
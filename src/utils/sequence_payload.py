@@ -0,0 +1,121 @@
+"""
+Request bodies for bulk sequence prediction (POST /predict/batch).
+
+Many (SEQUENCE_LENGTH, features) windows per request, in one of two compact
+binary encodings selected by Content-Type:
+
+- application/x-npy (or application/octet-stream): an .npy file
+  (np.save) of shape (n, T, F) or (T, F), any float dtype;
+- application/msgpack: a map {"shape": [n, T, F], "dtype": "float32",
+  "data": <bin, little-endian>} ("dtype" may be float16/float32/float64),
+  or {"sequences": [[[...]]]} as nested arrays. Needs the msgpack package.
+
+Both decode to one float32 (n, T, F) array, so the model is called once for
+the whole request.
+"""
+from __future__ import annotations
+
+import io
+from typing import Tuple
+
+import numpy as np
+
+NPY_TYPES = frozenset({"application/x-npy", "application/npy", "application/octet-stream"})
+MSGPACK_TYPES = frozenset({"application/msgpack", "application/x-msgpack", "application/vnd.msgpack"})
+MSGPACK_DTYPES = {"float16": "<f2", "float32": "<f4", "float64": "<f8"}
+
+
+# npy header (at most 64 KiB) / msgpack map and array headers
+HEADER_ALLOWANCE = 64 * 1024
+
+
+class PayloadError(ValueError):
+    """Body that can't be decoded into sequences; `status` is the HTTP status to answer with."""
+
+    def __init__(self, message: str, status: int = 422):
+        super().__init__(message)
+        self.status = status
+
+
+def max_body_bytes(sequence_length: int, num_features: int, max_sequences: int) -> int:
+    """
+    Largest body any accepted encoding can need for max_sequences sequences:
+    float64 values (9 bytes each as msgpack floats) plus framing. Anything
+    bigger can be refused before it is read.
+    """
+    return max_sequences * sequence_length * (num_features * 9 + 5) + HEADER_ALLOWANCE
+
+
+def load_npy(body: bytes) -> np.ndarray:
+    try:
+        array = np.load(io.BytesIO(body), allow_pickle=False)
+    except (ValueError, OSError, EOFError) as exc:
+        raise PayloadError(f"Invalid .npy body: {exc}") from None
+    if not isinstance(array, np.ndarray) or array.dtype.kind != "f":
+        raise PayloadError(f"Expected a float array, got {getattr(array, 'dtype', type(array).__name__)}")
+    return array
+
+
+def load_msgpack(body: bytes) -> np.ndarray:
+    try:
+        import msgpack
+    except ImportError:
+        raise PayloadError("msgpack bodies need the msgpack package; send application/x-npy", 415) from None
+    try:
+        payload = msgpack.unpackb(body, raw=False)
+    except Exception as exc:
+        raise PayloadError(f"Invalid msgpack body: {exc}") from None
+    if not isinstance(payload, dict):
+        raise PayloadError('Expected a msgpack map with "data" and "shape", or "sequences"')
+    if "sequences" in payload:
+        try:
+            return np.asarray(payload["sequences"], dtype=np.float32)
+        except (TypeError, ValueError) as exc:
+            raise PayloadError(f"Invalid sequences: {exc}") from None
+    dtype = MSGPACK_DTYPES.get(payload.get("dtype", "float32"))
+    shape, data = payload.get("shape"), payload.get("data")
+    if dtype is None:
+        raise PayloadError(f"dtype must be one of {sorted(MSGPACK_DTYPES)}")
+    if not isinstance(data, bytes) or not isinstance(shape, (list, tuple)):
+        raise PayloadError('Expected "data" (bin) and "shape" (array)')
+    try:
+        return np.frombuffer(data, dtype=dtype).reshape(shape)
+    except (TypeError, ValueError) as exc:
+        raise PayloadError(f"data does not match shape {shape}: {exc}") from None
+
+
+def parse_sequences(
+    body: bytes, content_type: str, sequence_length: int, num_features: int, max_sequences: int
+) -> np.ndarray:
+    """Decode a request body into a float32 (n, sequence_length, num_features) array; raises PayloadError."""
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in NPY_TYPES:
+        sequences = load_npy(body)
+    elif media_type in MSGPACK_TYPES:
+        sequences = load_msgpack(body)
+    else:
+        raise PayloadError(
+            f"Unsupported Content-Type {media_type or '(none)'}; use application/x-npy or application/msgpack", 415
+        )
+
+    if sequences.ndim == 2:
+        sequences = sequences[None]
+    if sequences.ndim != 3 or sequences.shape[1:] != (sequence_length, num_features):
+        raise PayloadError(f"Expected shape (n, {sequence_length}, {num_features}), got {sequences.shape}")
+    if not len(sequences):
+        raise PayloadError("Expected at least one sequence")
+    if len(sequences) > max_sequences:
+        raise PayloadError(f"Expected at most {max_sequences} sequences per request, got {len(sequences)}", 413)
+    sequences = sequences.astype(np.float32, copy=False)
+    if not np.isfinite(sequences).all():
+        raise PayloadError("Sequences contain NaN or infinite values")
+    return sequences
+
+
+def top_k_classes(probs: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(indices, probabilities) of the k most likely classes per row, most likely first."""
+    k = max(1, min(k, probs.shape[1]))
+    idx = np.argpartition(-probs, k - 1, axis=1)[:, :k]
+    values = np.take_along_axis(probs, idx, axis=1)
+    order = np.argsort(-values, axis=1)
+    return np.take_along_axis(idx, order, axis=1), np.take_along_axis(values, order, axis=1)
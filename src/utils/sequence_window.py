@@ -0,0 +1,84 @@
+"""
+Per-session sliding window of feature vectors with a prediction hop.
+
+Once the window is full, every new frame shifts it by one, and predicting on
+every frame mostly re-computes the previous answer. A SequenceWindow says
+when a prediction is actually due:
+
+    window.extend(vectors)
+    if window.due():
+        window.update(predict(window.array()))
+    probs = window.last
+
+- a window that gained no frames since the last prediction (the extractor
+  found no person) is never re-predicted;
+- otherwise a prediction runs once `hop` new frames have arrived, and the
+  first full window is always predicted.
+
+Frames that don't trigger a prediction reuse `last`, and are counted in
+`skipped` (and in the optional server-wide `totals` Counter).
+"""
+from __future__ import annotations
+
+import collections
+from typing import Deque, Iterable, Optional
+
+import numpy as np
+
+from src import config
+
+
+class SequenceWindow:
+    def __init__(
+        self,
+        length: int = config.SEQUENCE_LENGTH,
+        hop: int = config.PREDICTION_HOP,
+        totals: Optional[collections.Counter] = None,
+    ):
+        self.frames: Deque[np.ndarray] = collections.deque(maxlen=length)
+        self.hop = max(1, hop)
+        self.pending = 0  # frames added since the last prediction
+        self.last: Optional[np.ndarray] = None
+        self.predictions = 0
+        self.skipped = 0
+        self.totals = totals if totals is not None else collections.Counter()
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @property
+    def full(self) -> bool:
+        return len(self.frames) == self.frames.maxlen
+
+    def extend(self, vectors: Iterable[np.ndarray]) -> int:
+        """Append a frame's vectors (none when no person was found); returns how many."""
+        added = 0
+        for vector in vectors:
+            self.frames.append(vector)
+            added += 1
+        self.pending += added
+        return added
+
+    def due(self) -> bool:
+        """Whether the window should be predicted now; counts a skip when it is full but not due."""
+        if not self.full:
+            return False
+        if self.pending and (self.last is None or self.pending >= self.hop):
+            return True
+        self.skipped += 1
+        self.totals["skipped"] += 1
+        return False
+
+    def array(self) -> np.ndarray:
+        return np.array(self.frames)
+
+    def update(self, probs: np.ndarray):
+        self.last = probs
+        self.pending = 0
+        self.predictions += 1
+        self.totals["predicted"] += 1
+
+    def reset(self):
+        self.frames.clear()
+        self.pending = 0
+        self.last = None
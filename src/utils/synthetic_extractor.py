@@ -0,0 +1,149 @@
+"""
+Synthetic landmark extractor for benchmarking without a camera or MediaPipe.
+
+Generates a deterministic, smoothly moving upper-body signer: a fixed face
+mesh cloud around the head, shoulders/elbows/wrists from the pose subset and
+two 21-point hands whose wrists follow the pose wrists through a slow
+signing-like motion. The input image is ignored; each call can burn a
+configurable amount of time to stand in for MediaPipe's cost.
+"""
+from __future__ import annotations
+
+import collections
+import time
+from typing import Deque, List, Optional
+
+import numpy as np
+
+from src import config
+from src.utils.feature_schema import (
+    FACE_MESH_POINTS,
+    HAND_POINTS,
+    UPPER_BODY_INDICES,
+    FeatureSchema,
+    get_schema,
+)
+
+
+_POSE_POINTS = 33
+
+# Rest positions (normalized x, y) of the upper body subset, in the order of
+# UPPER_BODY_INDICES: nose, eyes, ears, shoulders, elbows, wrists
+_POSE_REST = np.array(
+    [
+        [0.50, 0.30],
+        [0.47, 0.28], [0.53, 0.28],
+        [0.44, 0.29], [0.56, 0.29],
+        [0.38, 0.45], [0.62, 0.45],
+        [0.34, 0.62], [0.66, 0.62],
+        [0.40, 0.55], [0.60, 0.55],
+    ],
+    dtype=np.float32,
+)
+
+
+class SyntheticExtractor:
+    """
+    Extractor-compatible stand-in that produces feature-schema vectors
+    (nominal block layout, i.e. without the legacy_v1 truncation shift).
+
+    cost_ms:  time spent per frame; sleeping by default (like MediaPipe, which
+              releases the GIL), or a busy loop with spin=True to load a core.
+    presence: fraction of frames with a person in them; the rest return None.
+    seed:     makes the landmark stream and presence pattern reproducible.
+    """
+
+    def __init__(
+        self,
+        cost_ms: float = config.SYNTHETIC_COST_MS,
+        presence: float = 1.0,
+        seed: int = 0,
+        spin: bool = False,
+        schema: Optional[FeatureSchema] = None,
+    ):
+        self.schema = schema or get_schema()
+        self.cost_ms = cost_ms
+        self.presence = presence
+        self.spin = spin
+        self._rng = np.random.default_rng(seed)
+        self._frame_index = 0
+        # Fixed per-signer shapes: face cloud and hand offsets from the wrist
+        self._face_shape = self._rng.normal(0.0, [0.045, 0.06, 0.02], size=(FACE_MESH_POINTS, 3)).astype(np.float32)
+        self._hand_shape = self._rng.normal(0.0, [0.03, 0.04, 0.01], size=(2, HAND_POINTS, 3)).astype(np.float32)
+        self._face_indices = np.array(self.schema.face_indices)
+        self._pose_indices = np.array(self.schema.pose_indices)
+        self._hand_shape[:, 0] = 0.0  # landmark 0 is the wrist itself
+        self._completed: Deque[Optional[np.ndarray]] = collections.deque()
+        self.processed_frames = 0
+        self.skipped_frames = 0
+
+    def _burn(self):
+        if self.cost_ms <= 0:
+            return
+        if not self.spin:
+            time.sleep(self.cost_ms / 1000.0)
+            return
+        deadline = time.perf_counter() + self.cost_ms / 1000.0
+        while time.perf_counter() < deadline:
+            pass
+
+    def extract_into(self, image: Optional[np.ndarray], out: np.ndarray, draw: bool = False) -> bool:
+        self._burn()
+        self.processed_frames += 1
+        t = self._frame_index / 30.0
+        self._frame_index += 1
+        if self._rng.random() >= self.presence:
+            self.skipped_frames += 1
+            out.fill(0.0)
+            return False
+
+        upper = np.zeros((len(UPPER_BODY_INDICES), 3), dtype=np.float32)
+        upper[:, :2] = _POSE_REST
+        # Hands circle in front of the chest, elbows follow halfway
+        swing = np.array([[np.sin(2.1 * t), np.cos(1.7 * t)], [np.sin(1.9 * t + 1.0), np.cos(2.3 * t)]], dtype=np.float32)
+        upper[9:11, :2] += 0.12 * swing
+        upper[7:9, :2] += 0.05 * swing
+        upper[:, :2] += self._rng.normal(0.0, 0.002, size=(len(UPPER_BODY_INDICES), 2))
+        pose = np.zeros((_POSE_POINTS, 3), dtype=np.float32)
+        pose[list(UPPER_BODY_INDICES)] = upper
+
+        face = self._face_shape.copy()
+        face[:, :2] += upper[0, :2]
+
+        hands = self._hand_shape.copy()
+        hands[:, :, :2] += upper[9:11, None, :2]
+        hands += self._rng.normal(0.0, 0.003, size=hands.shape).astype(np.float32)
+
+        schema = self.schema
+        out[schema.hand_offset : schema.hand_offset + schema.hand_size] = hands.reshape(-1)
+        out[schema.face_offset : schema.face_offset + schema.face_size] = face[self._face_indices].reshape(-1)
+        out[schema.pose_offset : schema.pose_offset + schema.pose_size] = pose[self._pose_indices].reshape(-1)
+        return True
+
+    def extract(self, image: Optional[np.ndarray], draw: bool = False) -> Optional[np.ndarray]:
+        out = np.empty(self.schema.num_features, dtype=np.float32)
+        return out if self.extract_into(image, out, draw=draw) else None
+
+    def submit(self, image: Optional[np.ndarray], timestamp_ms: Optional[int] = None, draw: bool = False):
+        self._completed.append(self.extract(image, draw=draw))
+
+    def poll(self) -> List[Optional[np.ndarray]]:
+        finished = list(self._completed)
+        self._completed.clear()
+        return finished
+
+    def reset(self):
+        self._frame_index = 0
+        self._completed.clear()
+
+    def stats(self) -> dict:
+        return {"processed_frames": self.processed_frames, "skipped_frames": self.skipped_frames}
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> "SyntheticExtractor":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
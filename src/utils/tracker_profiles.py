@@ -0,0 +1,64 @@
+"""
+Named speed/accuracy profiles for the landmark trackers.
+
+A profile bundles the knobs that trade accuracy for throughput:
+
+- tracker model complexity (hands 0-1, pose 0-2; on the tasks backend the
+  pose complexity picks the lite/full/heavy bundle)
+- face mesh iris refinement (always on when the feature schema needs the
+  iris points, i.e. legacy_v1)
+- input downscale factor applied before detection (landmarks are normalized,
+  so the output layout does not change)
+- extraction rate: how often pose and face mesh run (see POSE_EVERY_N_FRAMES)
+- detection / tracking confidences
+
+Select one per process with config.TRACKER_PROFILE (ISL_TRACKER_PROFILE) or
+the --tracker-profile flag of the scripts, and per websocket session with
+/ws?profile=<name>. Without a profile the individual config settings apply;
+they match "balanced". src/benchmarks/tracker_profiles.py measures FPS and
+accuracy of each profile on video_dataset.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from src import config
+
+
+@dataclass(frozen=True)
+class TrackerProfile:
+    name: str
+    hand_complexity: int = 1
+    pose_complexity: int = 1
+    refine_face: bool = False
+    downscale: float = 1.0  # 0.5 = detect on a half-size frame
+    pose_every: int = 1
+    face_every: int = 1
+    min_detection_confidence: float = 0.5
+    min_tracking_confidence: float = 0.5
+
+
+PROFILES: Dict[str, TrackerProfile] = {
+    profile.name: profile
+    for profile in (
+        TrackerProfile(
+            "fast", hand_complexity=0, pose_complexity=0, downscale=0.5, pose_every=2, face_every=3
+        ),
+        TrackerProfile("balanced"),
+        TrackerProfile(
+            "accurate", pose_complexity=2, refine_face=True, min_tracking_confidence=0.6
+        ),
+    )
+}
+TRACKER_PROFILES = tuple(PROFILES)
+
+
+def get_profile(name: Optional[str] = None) -> Optional[TrackerProfile]:
+    """Profile by name (default: config.TRACKER_PROFILE); None when no profile is selected."""
+    name = name or config.TRACKER_PROFILE
+    if not name:
+        return None
+    if name not in PROFILES:
+        raise ValueError(f"Unknown tracker profile: {name!r} (expected one of {TRACKER_PROFILES})")
+    return PROFILES[name]
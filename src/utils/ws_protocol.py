@@ -0,0 +1,113 @@
+"""
+Binary websocket protocol for /ws (and /ws/landmarks).
+
+Sending frames as JSON {"image": "data:image/jpeg;base64,..."} costs 33%
+base64 overhead plus a JSON parse and two copies per frame. Binary messages
+carry the encoded image as-is behind a 14-byte little-endian header:
+
+    offset  size  field
+    0       1     version      (PROTOCOL_VERSION)
+    1       1     kind         (KIND_JPEG: encoded image payload, /ws;
+                                KIND_LANDMARKS_F32 / KIND_LANDMARKS_I16: one
+                                feature-schema vector, /ws/landmarks)
+    2       4     sequence     uint32, chosen by the client, echoed in the reply
+    6       8     timestamp    float64, client clock (e.g. performance.now()), echoed
+    14      ...   payload
+
+Replies to binary messages are binary too, 20 bytes:
+
+    0       1     version
+    1       1     status       (STATUS_COLLECTING, STATUS_PREDICTION)
+    2       4     sequence     of the frame that completed the reply
+    6       8     timestamp    of that frame, for round-trip measurement
+    14      4     confidence   float32
+    18      2     label index  uint16 into GET /labels, NO_LABEL when collecting
+
+Landmark payloads hold exactly schema.num_features values (GET /schema) in
+the model's layout, little-endian: float32, or int16 quantized as
+round(value * LANDMARK_SCALE) (range +-4, step 1.2e-4, half the bytes). An
+all-zero vector means no person in the frame.
+
+Text messages keep the original JSON protocol, so older clients work unchanged.
+"""
+from __future__ import annotations
+
+import struct
+from typing import NamedTuple
+
+import numpy as np
+
+PROTOCOL_VERSION = 1
+
+KIND_JPEG = 0
+KIND_LANDMARKS_F32 = 1
+KIND_LANDMARKS_I16 = 2
+KINDS = frozenset({KIND_JPEG, KIND_LANDMARKS_F32, KIND_LANDMARKS_I16})
+
+LANDMARK_SCALE = 8192.0
+
+STATUS_COLLECTING = 0
+STATUS_PREDICTION = 1
+
+NO_LABEL = 0xFFFF
+
+FRAME_HEADER = struct.Struct("<BBId")
+REPLY = struct.Struct("<BBIdfH")
+
+
+class FrameHeader(NamedTuple):
+    version: int
+    kind: int
+    sequence: int
+    timestamp: float
+
+
+class ProtocolError(ValueError):
+    """Malformed binary message."""
+
+
+def parse_frame(message: bytes):
+    """Split a binary message into (FrameHeader, payload memoryview) without copying the payload."""
+    if len(message) < FRAME_HEADER.size:
+        raise ProtocolError(f"Binary frame shorter than its {FRAME_HEADER.size}-byte header")
+    header = FrameHeader(*FRAME_HEADER.unpack_from(message))
+    if header.version != PROTOCOL_VERSION:
+        raise ProtocolError(f"Unsupported protocol version {header.version}")
+    if header.kind not in KINDS:
+        raise ProtocolError(f"Unknown frame kind {header.kind}")
+    if len(message) == FRAME_HEADER.size:
+        raise ProtocolError("Binary frame has no payload")
+    return header, memoryview(message)[FRAME_HEADER.size :]
+
+
+def pack_frame(payload: bytes, sequence: int, timestamp: float, kind: int = KIND_JPEG) -> bytes:
+    return FRAME_HEADER.pack(PROTOCOL_VERSION, kind, sequence & 0xFFFFFFFF, timestamp) + payload
+
+
+def pack_reply(header: FrameHeader, label_index: int = NO_LABEL, confidence: float = 0.0) -> bytes:
+    status = STATUS_COLLECTING if label_index == NO_LABEL else STATUS_PREDICTION
+    return REPLY.pack(PROTOCOL_VERSION, status, header.sequence, header.timestamp, confidence, label_index)
+
+
+def pack_landmarks(vector: np.ndarray, sequence: int, timestamp: float, quantize: bool = False) -> bytes:
+    """Client side of /ws/landmarks: one vector as a binary frame."""
+    if quantize:
+        q = np.clip(np.rint(np.asarray(vector, dtype=np.float32) * LANDMARK_SCALE), -32768, 32767)
+        return pack_frame(q.astype("<i2").tobytes(), sequence, timestamp, KIND_LANDMARKS_I16)
+    return pack_frame(np.asarray(vector, dtype="<f4").tobytes(), sequence, timestamp, KIND_LANDMARKS_F32)
+
+
+def unpack_landmarks(header: FrameHeader, payload, num_features: int) -> np.ndarray:
+    """float32 vector from a /ws/landmarks payload; raises ProtocolError on a kind or size mismatch."""
+    if header.kind == KIND_LANDMARKS_F32:
+        dtype, scale = np.dtype("<f4"), None
+    elif header.kind == KIND_LANDMARKS_I16:
+        dtype, scale = np.dtype("<i2"), 1.0 / LANDMARK_SCALE
+    else:
+        raise ProtocolError(f"Expected a landmark frame, got kind {header.kind}")
+    if len(payload) != num_features * dtype.itemsize:
+        raise ProtocolError(f"Expected {num_features} {dtype.name} values, got {len(payload)} bytes")
+    vector = np.frombuffer(payload, dtype=dtype)
+    if scale is None:
+        return vector.astype(np.float32, copy=False)
+    return vector.astype(np.float32) * np.float32(scale)
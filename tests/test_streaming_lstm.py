@@ -0,0 +1,40 @@
+"""Streaming LSTM inference must reproduce the window model's predictions."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from src import config
+from src.models.lstm_classifier import build_model
+from src.models.streaming_lstm import StreamingLSTM
+
+NUM_FEATURES = 12
+NUM_CLASSES = 5
+
+
+@pytest.fixture(scope="module")
+def model():
+    return build_model(NUM_CLASSES, NUM_FEATURES)
+
+
+@pytest.mark.parametrize("streams", [1, config.SEQUENCE_LENGTH])
+def test_stream_matches_window_model(model, streams):
+    length = config.SEQUENCE_LENGTH
+    rng = np.random.default_rng(0)
+    # Nonzero frames, so none of them is masked out
+    frames = rng.uniform(0.05, 1.0, size=(3 * length, NUM_FEATURES)).astype(np.float32)
+
+    stream = StreamingLSTM.from_keras(model).stream(streams)
+    outputs, windows = [], []
+    for i, frame in enumerate(frames):
+        probs = stream.push(frame)
+        if probs is not None:
+            outputs.append(probs)
+            windows.append(frames[i + 1 - length : i + 1])
+
+    # k staggered streams complete a window every length / k frames once the first one is full
+    assert len(outputs) == 1 + (len(frames) - length) * streams // length
+    expected = model.predict(np.stack(windows), verbose=0)
+    np.testing.assert_allclose(np.stack(outputs), expected, atol=1e-5)